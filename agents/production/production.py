@@ -58,6 +58,10 @@ class ProductionAgent(Agent):
         if not self.has_pptx:
             self.logger.info("python-pptx not available - PPTX will fall back to HTML")
 
+        # Delegated generation skills, created on first use and reused so
+        # their per-instance caches (e.g. PDF styles) survive across calls
+        self._skills: Dict[type, Any] = {}
+
     def _check_dependency(self, module_name: str) -> bool:
         """Check if optional dependency is available."""
         try:
@@ -66,6 +70,15 @@ class ProductionAgent(Agent):
         except ImportError:
             return False
 
+    def _get_skill(self, skill_class: type) -> Any:
+        """Return this agent's instance of a generation skill, creating it on first use."""
+        skill = self._skills.get(skill_class)
+        if skill is None:
+            skill = self._skills[skill_class] = skill_class(config={
+                "output_dir": str(self.output_dir)
+            })
+        return skill
+
     def process(self, input_data: Dict[str, Any]) -> ProductionOutput:
         """
         Transform draft content into final formatted output.
@@ -452,11 +465,7 @@ class ProductionAgent(Agent):
 
         from skills.docx_generation.docx_generation import DocxGenerationSkill
 
-        skill = DocxGenerationSkill(config={
-            "output_dir": str(self.output_dir)
-        })
-
-        result = skill.execute(draft, brand_template=self.brand_template)
+        result = self._get_skill(DocxGenerationSkill).execute(draft, brand_template=self.brand_template)
 
         return ProductionOutput(
             file_path=result["file_path"],
@@ -478,11 +487,7 @@ class ProductionAgent(Agent):
 
         from skills.pdf_generation.pdf_generation import PdfGenerationSkill
 
-        skill = PdfGenerationSkill(config={
-            "output_dir": str(self.output_dir)
-        })
-
-        result = skill.execute(draft, brand_template=self.brand_template)
+        result = self._get_skill(PdfGenerationSkill).execute(draft, brand_template=self.brand_template)
 
         return ProductionOutput(
             file_path=result["file_path"],
@@ -504,11 +509,7 @@ class ProductionAgent(Agent):
 
         from skills.pptx_generation.pptx_generation import PptxGenerationSkill
 
-        skill = PptxGenerationSkill(config={
-            "output_dir": str(self.output_dir)
-        })
-
-        result = skill.execute(draft, brand_template=self.brand_template)
+        result = self._get_skill(PptxGenerationSkill).execute(draft, brand_template=self.brand_template)
 
         return ProductionOutput(
             file_path=result["file_path"],
@@ -186,8 +186,8 @@ def example_2_social_content():
 
         specs = social_skill.platform_specs[platform]
 
-        print(f"Character count: {len(draft.content)} / {specs['max_length']}")
-        print(f"Optimal range: {specs['optimal_length']}")
+        print(f"Character count: {len(draft.content)} / {specs.max_length}")
+        print(f"Optimal range: {specs.optimal_length}")
         print(f"\nContent:\n")
         print(draft.content)
         print()
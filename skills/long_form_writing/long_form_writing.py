@@ -8,15 +8,19 @@ Handles:
 - Case studies (1000-2000 words)
 """
 
-import sys
-import os
-sys.path.append(os.path.join(os.path.dirname(__file__), '../..'))
-
-from typing import Dict, List, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, List, Any, Optional, Sequence, Tuple
 from agents.base.agent import Skill
 from agents.base.models import ContentBrief, ContentType, ToneType
 
 
+@lru_cache(maxsize=1024)
+def _normalize_requirements(requirements: Tuple[str, ...]) -> str:
+    """Join and lowercase structure requirements for keyword matching."""
+    return " ".join(requirements).lower()
+
+
 class LongFormWritingSkill(Skill):
     """
     Generates long-form written content from content briefs.
@@ -158,6 +162,41 @@ class LongFormWritingSkill(Skill):
 
         return full_content
 
+    def execute_batch(
+        self,
+        content_briefs: Sequence[ContentBrief],
+        structure_types: Optional[Sequence[str]] = None,
+        max_workers: int = 8
+    ) -> List[str]:
+        """
+        Generate long-form content for several briefs.
+
+        Briefs are independent, so they are dispatched to a thread pool
+        sharing this skill's structure and hook tables.
+
+        Args:
+            content_briefs: Content briefs to generate from
+            structure_types: Structure type per brief (defaults to problem_solution)
+            max_workers: Maximum number of worker threads
+
+        Returns:
+            Generated markdown strings, in the same order as the briefs
+        """
+        if structure_types is None:
+            structure_types = ["problem_solution"] * len(content_briefs)
+        elif len(structure_types) != len(content_briefs):
+            raise ValueError(
+                f"Expected {len(content_briefs)} structure types, got {len(structure_types)}"
+            )
+
+        if not content_briefs:
+            return []
+
+        self.logger.info(f"Generating batch of {len(content_briefs)} long-form pieces")
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(content_briefs))) as executor:
+            return list(executor.map(self.execute, content_briefs, structure_types))
+
     def _infer_structure(self, brief: ContentBrief) -> str:
         """Infer best structure type from content brief."""
         # Check content type
@@ -167,7 +206,7 @@ class LongFormWritingSkill(Skill):
             return "narrative"
 
         # Check structure requirements for hints
-        structure_text = " ".join(brief.structure_requirements).lower()
+        structure_text = _normalize_requirements(tuple(brief.structure_requirements))
 
         if "step" in structure_text or "how to" in structure_text:
             return "how_to"
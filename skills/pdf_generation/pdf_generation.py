@@ -10,8 +10,11 @@ This skill transforms markdown content into formatted PDF files with:
 
 import sys
 import os
+import io
 sys.path.append(os.path.join(os.path.dirname(__file__), '../..'))
 
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from typing import Dict, Any, Optional, List
 from agents.base.agent import Skill
 from agents.base.models import DraftContent
@@ -19,6 +22,106 @@ from datetime import datetime
 import re
 
 
+# Markdown patterns, compiled once for the per-line parsing hot path
+_BOLD_RE = re.compile(r'\*\*(.+?)\*\*')
+_ITALIC_RE = re.compile(r'(?<!\*)\*(?!\*)(.+?)(?<!\*)\*(?!\*)')
+_CODE_RE = re.compile(r'`(.+?)`')
+_ORDERED_RE = re.compile(r'^\d+\.\s')
+
+try:
+    from reportlab.lib.pagesizes import letter, A4
+    from reportlab.lib.units import inch
+    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.lib.enums import TA_JUSTIFY, TA_CENTER
+    from reportlab.lib import colors
+    from reportlab import rl_config
+    REPORTLAB_AVAILABLE = True
+except ImportError:
+    # execute() falls back to mock output when reportlab is missing
+    REPORTLAB_AVAILABLE = False
+    inch = 72.0
+
+# Vertical spacing used between flowables
+_SP_S = 0.1 * inch
+_SP_M = 0.15 * inch
+_SP_L = 0.2 * inch
+_SP_XL = 0.3 * inch
+
+_BASE_STYLES = None
+_SHAPE_CHECKING_DISABLED = False
+
+
+def _get_base_styles():
+    """Return the shared reportlab sample stylesheet, building it on first use."""
+    global _BASE_STYLES
+    if _BASE_STYLES is None:
+        _BASE_STYLES = getSampleStyleSheet()
+    return _BASE_STYLES
+
+
+def _disable_shape_checking():
+    """Turn off reportlab's per-attribute shape validation (once per process)."""
+    global _SHAPE_CHECKING_DISABLED
+    if not _SHAPE_CHECKING_DISABLED:
+        rl_config.shapeChecking = 0
+        _SHAPE_CHECKING_DISABLED = True
+
+
+@lru_cache(maxsize=64)
+def _hex_to_color(hex_string: str):
+    """Convert hex color to reportlab color."""
+    r, g, b = bytes.fromhex(hex_string.lstrip('#')[:6])
+    return colors.Color(r/255.0, g/255.0, b/255.0)
+
+
+# Block-level markdown handlers, each appending flowables for one line
+def _h1_handler(line: str, styles: Dict, elements: List):
+    elements.append(Spacer(1, _SP_L))
+    elements.append(Paragraph(line[2:].strip(), styles.get('Heading1')))
+
+
+def _h2_handler(line: str, styles: Dict, elements: List):
+    elements.append(Spacer(1, _SP_M))
+    elements.append(Paragraph(line[3:].strip(), styles.get('Heading2')))
+
+
+def _h3_handler(line: str, styles: Dict, elements: List):
+    elements.append(Spacer(1, _SP_S))
+    elements.append(Paragraph(line[4:].strip(), styles.get('Heading3')))
+
+
+def _h4_handler(line: str, styles: Dict, elements: List):
+    elements.append(Paragraph(line[5:].strip(), styles.get('Heading3')))
+
+
+def _bullet_handler(line: str, styles: Dict, elements: List):
+    elements.append(Paragraph(f"• {line[2:].strip()}", styles.get('Bullet')))
+
+
+def _quote_handler(line: str, styles: Dict, elements: List):
+    elements.append(Paragraph(f"<i>{line[2:].strip()}</i>", styles.get('BodyText')))
+
+
+def _hr_handler(line: str, styles: Dict, elements: List):
+    elements.append(Spacer(1, _SP_S))
+    elements.append(Paragraph('_' * 80, styles.get('BodyText')))
+    elements.append(Spacer(1, _SP_S))
+
+
+# Line prefix -> handler; probed with 2-5 character prefixes per line.
+# Horizontal rules only match an exact '---' line and are checked separately.
+_PREFIX_TABLE = {
+    '# ': _h1_handler,
+    '## ': _h2_handler,
+    '### ': _h3_handler,
+    '#### ': _h4_handler,
+    '- ': _bullet_handler,
+    '* ': _bullet_handler,
+    '> ': _quote_handler,
+}
+
+
 class PdfGenerationSkill(Skill):
     """
     Generates PDF documents from draft content using reportlab.
@@ -38,6 +141,9 @@ class PdfGenerationSkill(Skill):
         # Ensure directories exist
         os.makedirs(self.output_dir, exist_ok=True)
 
+        # Built paragraph styles per brand, reused across execute() calls
+        self._styles_cache: Dict[Any, Dict[str, Any]] = {}
+
     def execute(self, input_data: DraftContent, **kwargs) -> Dict[str, Any]:
         """
         Generate PDF document from draft content.
@@ -48,6 +154,7 @@ class PdfGenerationSkill(Skill):
                 - brand_template: BrandTemplate for styling
                 - include_toc: Include table of contents (default: False)
                 - page_numbers: Add page numbers (default: True)
+                - filename: Output filename (default: <content_type>_<timestamp>.pdf)
 
         Returns:
             Dictionary with:
@@ -55,16 +162,7 @@ class PdfGenerationSkill(Skill):
                 - success: Boolean indicating success
                 - metadata: Additional information
         """
-        try:
-            from reportlab.lib.pagesizes import letter, A4
-            from reportlab.lib.units import inch
-            from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, PageBreak
-            from reportlab.platypus import ListFlowable, ListItem
-            from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-            from reportlab.lib.enums import TA_JUSTIFY, TA_CENTER, TA_LEFT
-            from reportlab.lib import colors
-            from reportlab.pdfgen import canvas
-        except ImportError:
+        if not REPORTLAB_AVAILABLE:
             self.logger.error("reportlab not installed. Install with: pip install reportlab")
             return self._generate_mock_pdf(input_data, **kwargs)
 
@@ -73,8 +171,9 @@ class PdfGenerationSkill(Skill):
         page_numbers = kwargs.get("page_numbers", True)
 
         # Generate filename
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"{input_data.content_type.value}_{timestamp}.pdf"
+        now = datetime.now()
+        timestamp = now.strftime("%Y%m%d_%H%M%S")
+        filename = kwargs.get("filename") or f"{input_data.content_type.value}_{timestamp}.pdf"
         file_path = os.path.join(self.output_dir, filename)
 
         # Determine page size
@@ -83,9 +182,13 @@ class PdfGenerationSkill(Skill):
             if brand_template.document_layout.page_size == "a4":
                 page_size = A4
 
-        # Create PDF document
+        # Attribute values are produced by our own style code, skip re-validation
+        _disable_shape_checking()
+
+        # Create PDF document, rendered in memory and written out in one call
+        buffer = io.BytesIO()
         doc = SimpleDocTemplate(
-            file_path,
+            buffer,
             pagesize=page_size,
             rightMargin=72,
             leftMargin=72,
@@ -102,7 +205,7 @@ class PdfGenerationSkill(Skill):
             doc.bottomMargin = layout.margin_bottom * inch
 
         # Create styles
-        styles = self._create_styles(brand_template)
+        styles = self._get_styles(brand_template)
 
         # Build content
         story = []
@@ -112,7 +215,7 @@ class PdfGenerationSkill(Skill):
             story.append(Paragraph(brand_template.company_name, styles['BrandHeader']))
             if brand_template.company_tagline:
                 story.append(Paragraph(brand_template.company_tagline, styles['BrandTagline']))
-            story.append(Spacer(1, 0.3 * inch))
+            story.append(Spacer(1, _SP_XL))
 
         # Parse markdown and add to story
         elements = self._parse_markdown_to_elements(input_data.content, styles, brand_template)
@@ -121,10 +224,10 @@ class PdfGenerationSkill(Skill):
         # Add brand footer content
         if brand_template:
             story.append(Spacer(1, 0.5 * inch))
-            footer_text = f"© {datetime.now().year} {brand_template.company_name}"
+            footer_text = f"© {now.year} {brand_template.company_name}"
             if brand_template.website:
                 footer_text += f" | {brand_template.website}"
-            footer_text += f" | Generated {datetime.now().strftime('%B %d, %Y')}"
+            footer_text += f" | Generated {now.strftime('%B %d, %Y')}"
             story.append(Paragraph(footer_text, styles['FooterText']))
 
         # Build PDF with page numbers
@@ -134,6 +237,9 @@ class PdfGenerationSkill(Skill):
         else:
             doc.build(story)
 
+        with open(file_path, 'wb') as f:
+            f.write(buffer.getbuffer())
+
         self.logger.info(f"Generated PDF: {file_path}")
 
         return {
@@ -143,34 +249,39 @@ class PdfGenerationSkill(Skill):
                 "word_count": input_data.word_count,
                 "page_size": brand_template.document_layout.page_size if brand_template else "letter",
                 "brand_template": brand_template.name if brand_template else None,
-                "created_at": datetime.now().isoformat()
+                "created_at": now.isoformat()
             }
         }
 
+    def _get_styles(self, brand_template: Any = None) -> Dict[str, Any]:
+        """Return styles for a brand template, building them on first use."""
+        # Templates are frozen and hash by value, so custom templates sharing
+        # a name don't collide
+        key = brand_template or None
+        styles = self._styles_cache.get(key)
+        if styles is None:
+            styles = self._styles_cache[key] = self._create_styles(brand_template)
+        return styles
+
     def _create_styles(self, brand_template: Any = None) -> Dict[str, Any]:
         """Create reportlab styles from brand template."""
-        from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-        from reportlab.lib.enums import TA_JUSTIFY, TA_CENTER, TA_LEFT
-        from reportlab.lib.units import inch
-        from reportlab.lib import colors
-
         styles_dict = {}
-        base_styles = getSampleStyleSheet()
-
-        # Helper to convert hex to reportlab color
-        def hex_to_color(hex_string: str):
-            """Convert hex color to reportlab color."""
-            hex_string = hex_string.lstrip('#')
-            r, g, b = tuple(int(hex_string[i:i+2], 16) for i in (0, 2, 4))
-            return colors.Color(r/255.0, g/255.0, b/255.0)
+        base_styles = _get_base_styles()
 
         if brand_template:
+            typography = brand_template.typography
+            palette = brand_template.colors
+            primary = _hex_to_color(palette.primary)
+            secondary = _hex_to_color(palette.secondary)
+            text_color = _hex_to_color(palette.text)
+            text_light = _hex_to_color(palette.text_light)
+
             # Brand-specific styles
             styles_dict['BrandHeader'] = ParagraphStyle(
                 'BrandHeader',
                 parent=base_styles['Heading1'],
-                fontSize=brand_template.typography.h1_size + 4,
-                textColor=hex_to_color(brand_template.colors.primary),
+                fontSize=typography.h1_size + 4,
+                textColor=primary,
                 alignment=TA_CENTER,
                 spaceAfter=6,
                 fontName='Helvetica-Bold'
@@ -179,8 +290,8 @@ class PdfGenerationSkill(Skill):
             styles_dict['BrandTagline'] = ParagraphStyle(
                 'BrandTagline',
                 parent=base_styles['Normal'],
-                fontSize=brand_template.typography.small_size,
-                textColor=hex_to_color(brand_template.colors.text_light),
+                fontSize=typography.small_size,
+                textColor=text_light,
                 alignment=TA_CENTER,
                 fontStyle='italic',
                 spaceAfter=12
@@ -189,8 +300,8 @@ class PdfGenerationSkill(Skill):
             styles_dict['Heading1'] = ParagraphStyle(
                 'CustomHeading1',
                 parent=base_styles['Heading1'],
-                fontSize=brand_template.typography.h1_size,
-                textColor=hex_to_color(brand_template.colors.primary),
+                fontSize=typography.h1_size,
+                textColor=primary,
                 spaceAfter=12,
                 spaceBefore=20,
                 fontName='Helvetica-Bold'
@@ -199,8 +310,8 @@ class PdfGenerationSkill(Skill):
             styles_dict['Heading2'] = ParagraphStyle(
                 'CustomHeading2',
                 parent=base_styles['Heading2'],
-                fontSize=brand_template.typography.h2_size,
-                textColor=hex_to_color(brand_template.colors.secondary),
+                fontSize=typography.h2_size,
+                textColor=secondary,
                 spaceAfter=10,
                 spaceBefore=16,
                 fontName='Helvetica-Bold'
@@ -209,8 +320,8 @@ class PdfGenerationSkill(Skill):
             styles_dict['Heading3'] = ParagraphStyle(
                 'CustomHeading3',
                 parent=base_styles['Heading3'],
-                fontSize=brand_template.typography.h3_size,
-                textColor=hex_to_color(brand_template.colors.secondary),
+                fontSize=typography.h3_size,
+                textColor=secondary,
                 spaceAfter=8,
                 spaceBefore=12,
                 fontName='Helvetica-Bold'
@@ -219,8 +330,8 @@ class PdfGenerationSkill(Skill):
             styles_dict['BodyText'] = ParagraphStyle(
                 'CustomBody',
                 parent=base_styles['BodyText'],
-                fontSize=brand_template.typography.body_size,
-                textColor=hex_to_color(brand_template.colors.text),
+                fontSize=typography.body_size,
+                textColor=text_color,
                 alignment=TA_JUSTIFY,
                 spaceAfter=brand_template.document_layout.paragraph_spacing_after,
                 fontName='Helvetica'
@@ -229,8 +340,8 @@ class PdfGenerationSkill(Skill):
             styles_dict['FooterText'] = ParagraphStyle(
                 'FooterText',
                 parent=base_styles['Normal'],
-                fontSize=brand_template.typography.small_size,
-                textColor=hex_to_color(brand_template.colors.text_light),
+                fontSize=typography.small_size,
+                textColor=text_light,
                 alignment=TA_CENTER
             )
 
@@ -253,96 +364,74 @@ class PdfGenerationSkill(Skill):
 
     def _parse_markdown_to_elements(self, content: str, styles: Dict, brand_template: Any = None) -> List:
         """Convert markdown content to reportlab elements."""
-        from reportlab.platypus import Paragraph, Spacer
-        from reportlab.lib.units import inch
-
         elements = []
-        lines = content.split('\n')
-        i = 0
+        blank_count = 0
 
-        while i < len(lines):
-            line = lines[i].strip()
+        # Loop-invariant lookups, bound once outside the per-line loop
+        prefix_handler = _PREFIX_TABLE.get
+        process_inline = self._process_inline_formatting
+        bullet_style = styles.get('Bullet')
+        body_style = styles.get('BodyText')
 
+        for raw_line in content.splitlines():
+            line = raw_line.strip()
+
+            # Coalesce runs of blank lines into a single spacer
             if not line:
-                elements.append(Spacer(1, 0.1 * inch))
-                i += 1
+                blank_count += 1
                 continue
 
-            # Heading 1
-            if line.startswith('# '):
-                text = line[2:].strip()
-                elements.append(Spacer(1, 0.2 * inch))
-                elements.append(Paragraph(text, styles.get('Heading1')))
-
-            # Heading 2
-            elif line.startswith('## '):
-                text = line[3:].strip()
-                elements.append(Spacer(1, 0.15 * inch))
-                elements.append(Paragraph(text, styles.get('Heading2')))
-
-            # Heading 3
-            elif line.startswith('### '):
-                text = line[4:].strip()
-                elements.append(Spacer(1, 0.1 * inch))
-                elements.append(Paragraph(text, styles.get('Heading3')))
-
-            # Heading 4
-            elif line.startswith('#### '):
-                text = line[5:].strip()
-                elements.append(Paragraph(text, styles.get('Heading3')))
-
-            # Unordered list
-            elif line.startswith('- ') or line.startswith('* '):
-                text = line[2:].strip()
-                bullet_text = f"• {text}"
-                elements.append(Paragraph(bullet_text, styles.get('Bullet')))
+            if blank_count:
+                elements.append(Spacer(1, blank_count * _SP_S))
+                blank_count = 0
+
+            # Prefix-keyed block elements (headings, lists, quotes, rules)
+            if line == '---':
+                handler = _hr_handler
+            else:
+                handler = (
+                    prefix_handler(line[:2])
+                    or prefix_handler(line[:3])
+                    or prefix_handler(line[:4])
+                    or prefix_handler(line[:5])
+                )
+
+            if handler:
+                handler(line, styles, elements)
 
             # Ordered list
-            elif re.match(r'^\d+\.\s', line):
+            elif line[0] in '0123456789' and _ORDERED_RE.match(line):
                 text = line[line.index('.') + 1:].strip()
                 number = line[:line.index('.')]
                 numbered_text = f"{number}. {text}"
-                elements.append(Paragraph(numbered_text, styles.get('Bullet')))
-
-            # Blockquote
-            elif line.startswith('> '):
-                text = line[2:].strip()
-                quote_text = f"<i>{text}</i>"
-                elements.append(Paragraph(quote_text, styles.get('BodyText')))
-
-            # Horizontal rule
-            elif line.strip() == '---':
-                elements.append(Spacer(1, 0.1 * inch))
-                elements.append(Paragraph('_' * 80, styles.get('BodyText')))
-                elements.append(Spacer(1, 0.1 * inch))
+                elements.append(Paragraph(numbered_text, bullet_style))
 
             # Regular paragraph
             else:
                 # Handle inline formatting (bold, italic)
-                text = self._process_inline_formatting(line)
-                elements.append(Paragraph(text, styles.get('BodyText')))
+                text = process_inline(line)
+                elements.append(Paragraph(text, body_style))
 
-            i += 1
+        if blank_count:
+            elements.append(Spacer(1, blank_count * _SP_S))
 
         return elements
 
     def _process_inline_formatting(self, text: str) -> str:
         """Process inline markdown formatting for reportlab."""
         # Bold: **text** -> <b>text</b>
-        text = re.sub(r'\*\*(.+?)\*\*', r'<b>\1</b>', text)
+        text = _BOLD_RE.sub(r'<b>\1</b>', text)
 
         # Italic: *text* -> <i>text</i>
-        text = re.sub(r'(?<!\*)\*(?!\*)(.+?)(?<!\*)\*(?!\*)', r'<i>\1</i>', text)
+        text = _ITALIC_RE.sub(r'<i>\1</i>', text)
 
         # Inline code: `text` -> <font name="Courier">text</font>
-        text = re.sub(r'`(.+?)`', r'<font name="Courier">\1</font>', text)
+        text = _CODE_RE.sub(r'<font name="Courier">\1</font>', text)
 
         return text
 
     def _add_page_decorations(self, canvas: Any, doc: Any, brand_template: Any):
         """Add headers, footers, and page numbers."""
-        from reportlab.lib.units import inch
-
         canvas.saveState()
 
         # Page number
@@ -359,27 +448,28 @@ class PdfGenerationSkill(Skill):
         Generate a mock PDF file when reportlab is not available.
         Creates a simple text file with .pdf extension for development.
         """
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"{draft.content_type.value}_{timestamp}.pdf"
+        now = datetime.now()
+        timestamp = now.strftime("%Y%m%d_%H%M%S")
+        filename = kwargs.get("filename") or f"{draft.content_type.value}_{timestamp}.pdf"
         file_path = os.path.join(self.output_dir, filename)
 
         brand_template = kwargs.get("brand_template")
 
         # Create a simple text representation
-        content = f"""PDF Document (Mock)
+        parts = [f"""PDF Document (Mock)
 {'=' * 50}
 
 Content Type: {draft.content_type.value}
 Word Count: {draft.word_count}
-Created: {datetime.now().isoformat()}
-"""
+Created: {now.isoformat()}
+"""]
 
         if brand_template:
-            content += f"""Brand Template: {brand_template.name}
+            parts.append(f"""Brand Template: {brand_template.name}
 Company: {brand_template.company_name}
-"""
+""")
 
-        content += f"""
+        parts.append(f"""
 {'=' * 50}
 
 {draft.content}
@@ -387,7 +477,8 @@ Company: {brand_template.company_name}
 {'=' * 50}
 Note: This is a mock PDF file. Install reportlab for real PDF generation.
 pip install reportlab Pillow
-"""
+""")
+        content = ''.join(parts)
 
         with open(file_path, 'w', encoding='utf-8') as f:
             f.write(content)
@@ -400,10 +491,49 @@ pip install reportlab Pillow
             "metadata": {
                 "word_count": draft.word_count,
                 "mock": True,
-                "created_at": datetime.now().isoformat()
+                "created_at": now.isoformat()
             }
         }
 
+    def execute_batch(
+        self,
+        inputs: List[DraftContent],
+        max_workers: Optional[int] = None,
+        **kwargs
+    ) -> List[Dict[str, Any]]:
+        """
+        Generate PDF documents for several drafts in parallel.
+
+        Rendering is CPU-bound and shares no state between documents, so each
+        draft is rendered in its own worker process.
+
+        Args:
+            inputs: DraftContent objects to render
+            max_workers: Worker process count (default: os.cpu_count())
+            **kwargs: Same options as execute(), applied to every draft. A
+                filename is used as a stem: each draft gets an _<n> suffix
+
+        Returns:
+            List of execute() result dictionaries, in input order
+        """
+        if not inputs:
+            return []
+
+        # Distinct filenames so documents rendered in the same second (or
+        # sharing a caller-supplied filename) don't collide
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        stem, suffix = os.path.splitext(kwargs["filename"]) if kwargs.get("filename") else ("", "")
+        suffix = suffix or ".pdf"
+
+        jobs = []
+        for i, draft in enumerate(inputs, 1):
+            prefix = stem or f"{draft.content_type.value}_{timestamp}"
+            jobs.append((self.config, draft, {**kwargs, "filename": f"{prefix}_{i}{suffix}"}))
+
+        workers = min(max_workers or os.cpu_count() or 1, len(jobs))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(_render_pdf, jobs))
+
     def validate_requirements(self) -> tuple[bool, list[str]]:
         """Validate that required dependencies are available."""
         missing = []
@@ -419,3 +549,9 @@ pip install reportlab Pillow
             missing.append("Pillow")
 
         return len(missing) == 0, missing
+
+
+def _render_pdf(job: tuple) -> Dict[str, Any]:
+    """Render one document in a worker process (module-level so it pickles)."""
+    config, draft, kwargs = job
+    return PdfGenerationSkill(config).execute(draft, **kwargs)
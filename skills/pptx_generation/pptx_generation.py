@@ -12,6 +12,8 @@ import sys
 import os
 sys.path.append(os.path.join(os.path.dirname(__file__), '../..'))
 
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from typing import Dict, Any, Optional, List
 from agents.base.agent import Skill
 from agents.base.models import DraftContent
@@ -19,6 +21,45 @@ from datetime import datetime
 import re
 
 
+try:
+    from pptx import Presentation
+    from pptx.util import Inches, Pt
+    from pptx.enum.text import PP_ALIGN
+    from pptx.dml.color import RGBColor
+    PPTX_AVAILABLE = True
+
+    # Fixed slide geometry and font sizes, built once instead of per slide
+    _IN_0_5 = Inches(0.5)
+    _IN_0_75 = Inches(0.75)
+    _IN_1 = Inches(1)
+    _IN_1_5 = Inches(1.5)
+    _IN_2_5 = Inches(2.5)
+    _IN_3 = Inches(3)
+    _IN_4 = Inches(4)
+    _IN_4_5 = Inches(4.5)
+    _IN_5_5 = Inches(5.5)
+    _IN_7_5 = Inches(7.5)
+    _IN_8 = Inches(8)
+    _IN_8_5 = Inches(8.5)
+    _IN_9 = Inches(9)
+    _IN_10 = Inches(10)
+    _PT_16 = Pt(16)
+    _PT_18 = Pt(18)
+    _PT_24 = Pt(24)
+    _PT_32 = Pt(32)
+    _PT_36 = Pt(36)
+    _PT_44 = Pt(44)
+except ImportError:
+    # execute() falls back to mock output when python-pptx is missing
+    PPTX_AVAILABLE = False
+
+
+@lru_cache(maxsize=64)
+def _hex_to_rgb(hex_color: str) -> tuple:
+    """Convert hex color to RGB tuple."""
+    return tuple(bytes.fromhex(hex_color.lstrip('#')[:6]))
+
+
 class PptxGenerationSkill(Skill):
     """
     Generates PowerPoint (PPTX) presentations from draft content.
@@ -47,6 +88,7 @@ class PptxGenerationSkill(Skill):
             **kwargs:
                 - brand_template: BrandTemplate for styling
                 - slide_numbers: Add slide numbers (default: True)
+                - filename: Output filename (default: <content_type>_<timestamp>.pptx)
 
         Returns:
             Dictionary with:
@@ -54,12 +96,7 @@ class PptxGenerationSkill(Skill):
                 - success: Boolean indicating success
                 - metadata: Additional information
         """
-        try:
-            from pptx import Presentation
-            from pptx.util import Inches, Pt
-            from pptx.enum.text import PP_ALIGN
-            from pptx.dml.color import RGBColor
-        except ImportError:
+        if not PPTX_AVAILABLE:
             self.logger.error("python-pptx not installed. Install with: pip install python-pptx")
             return self._generate_mock_pptx(input_data, **kwargs)
 
@@ -75,8 +112,8 @@ class PptxGenerationSkill(Skill):
             prs.slide_width = Inches(layout.slide_width)
             prs.slide_height = Inches(layout.slide_height)
         else:
-            prs.slide_width = Inches(10)
-            prs.slide_height = Inches(7.5)
+            prs.slide_width = _IN_10
+            prs.slide_height = _IN_7_5
 
         # Add title slide
         self._add_title_slide(prs, input_data, brand_template)
@@ -88,8 +125,9 @@ class PptxGenerationSkill(Skill):
         self._add_closing_slide(prs, brand_template)
 
         # Generate filename and save
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"{input_data.content_type.value}_{timestamp}.pptx"
+        now = datetime.now()
+        timestamp = now.strftime("%Y%m%d_%H%M%S")
+        filename = kwargs.get("filename") or f"{input_data.content_type.value}_{timestamp}.pptx"
         file_path = os.path.join(self.output_dir, filename)
 
         prs.save(file_path)
@@ -102,21 +140,18 @@ class PptxGenerationSkill(Skill):
                 "word_count": input_data.word_count,
                 "slides": len(prs.slides),
                 "brand_template": brand_template.name if brand_template else None,
-                "created_at": datetime.now().isoformat()
+                "created_at": now.isoformat()
             }
         }
 
     def _add_title_slide(self, prs: Any, draft: DraftContent, brand_template: Any = None):
         """Add title slide to presentation."""
-        from pptx.util import Pt
-        from pptx.enum.text import PP_ALIGN
-
         # Use blank layout
         slide = prs.slides.add_slide(prs.slide_layouts[6])  # Blank layout
 
         # Add title
         title_box = slide.shapes.add_textbox(
-            Inches(0.5), Inches(2.5), Inches(9), Inches(1.5)
+            _IN_0_5, _IN_2_5, _IN_9, _IN_1_5
         )
         title_frame = title_box.text_frame
         title_frame.text = draft.content_type.value.replace('_', ' ').title()
@@ -124,24 +159,25 @@ class PptxGenerationSkill(Skill):
         # Style title
         p = title_frame.paragraphs[0]
         p.alignment = PP_ALIGN.CENTER
-        p.font.size = Pt(44)
+        p.font.size = _PT_44
         p.font.bold = True
 
         if brand_template:
-            r, g, b = self._hex_to_rgb(brand_template.colors.primary)
+            palette = brand_template.colors
+            r, g, b = _hex_to_rgb(palette.primary)
             p.font.color.rgb = RGBColor(r, g, b)
 
             # Add company name subtitle
             subtitle_box = slide.shapes.add_textbox(
-                Inches(0.5), Inches(4.5), Inches(9), Inches(0.75)
+                _IN_0_5, _IN_4_5, _IN_9, _IN_0_75
             )
             subtitle_frame = subtitle_box.text_frame
             subtitle_frame.text = brand_template.company_name
 
             p = subtitle_frame.paragraphs[0]
             p.alignment = PP_ALIGN.CENTER
-            p.font.size = Pt(24)
-            r, g, b = self._hex_to_rgb(brand_template.colors.secondary)
+            p.font.size = _PT_24
+            r, g, b = _hex_to_rgb(palette.secondary)
             p.font.color.rgb = RGBColor(r, g, b)
 
         # Apply background color if brand template
@@ -150,32 +186,30 @@ class PptxGenerationSkill(Skill):
 
     def _add_closing_slide(self, prs: Any, brand_template: Any = None):
         """Add closing/thank you slide."""
-        from pptx.util import Pt
-        from pptx.enum.text import PP_ALIGN
-
         if not brand_template:
             return
 
+        palette = brand_template.colors
         slide = prs.slides.add_slide(prs.slide_layouts[6])  # Blank layout
 
         # Thank you message
         title_box = slide.shapes.add_textbox(
-            Inches(1), Inches(2.5), Inches(8), Inches(1)
+            _IN_1, _IN_2_5, _IN_8, _IN_1
         )
         title_frame = title_box.text_frame
         title_frame.text = "Thank You"
 
         p = title_frame.paragraphs[0]
         p.alignment = PP_ALIGN.CENTER
-        p.font.size = Pt(44)
+        p.font.size = _PT_44
         p.font.bold = True
 
-        r, g, b = self._hex_to_rgb(brand_template.colors.primary)
+        r, g, b = _hex_to_rgb(palette.primary)
         p.font.color.rgb = RGBColor(r, g, b)
 
         # Contact info
         contact_box = slide.shapes.add_textbox(
-            Inches(1), Inches(4), Inches(8), Inches(1.5)
+            _IN_1, _IN_4, _IN_8, _IN_1_5
         )
         contact_frame = contact_box.text_frame
 
@@ -185,22 +219,21 @@ class PptxGenerationSkill(Skill):
 
         contact_frame.text = '\n'.join(lines)
 
+        text_rgb = RGBColor(*_hex_to_rgb(palette.text))
         for p in contact_frame.paragraphs:
             p.alignment = PP_ALIGN.CENTER
-            p.font.size = Pt(18)
-            r, g, b = self._hex_to_rgb(brand_template.colors.text)
-            p.font.color.rgb = RGBColor(r, g, b)
+            p.font.size = _PT_18
+            p.font.color.rgb = text_rgb
 
         self._apply_slide_background(slide, brand_template)
 
     def _parse_content_to_slides(self, prs: Any, content: str, brand_template: Any = None):
         """Convert markdown content to slides."""
-        lines = content.split('\n')
         current_slide = None
         current_content = []
         slide_title = None
 
-        for line in lines:
+        for line in content.splitlines():
             stripped = line.strip()
 
             # H1 = Section divider slide
@@ -230,7 +263,7 @@ class PptxGenerationSkill(Skill):
 
             # H3 or H4 = Sub-bullet or content
             elif stripped.startswith('### ') or stripped.startswith('#### '):
-                text = stripped.lstrip('#').strip()
+                text = stripped[4:].strip() if stripped[3] == ' ' else stripped[5:].strip()
                 if current_content:  # Add as sub-bullet
                     current_content.append(('sub', text))
                 else:  # Add as regular bullet
@@ -251,61 +284,58 @@ class PptxGenerationSkill(Skill):
 
     def _add_section_slide(self, prs: Any, title: str, brand_template: Any = None):
         """Add a section divider slide."""
-        from pptx.util import Pt
-        from pptx.enum.text import PP_ALIGN
-
         slide = prs.slides.add_slide(prs.slide_layouts[6])  # Blank layout
 
         # Add section title
         title_box = slide.shapes.add_textbox(
-            Inches(1), Inches(3), Inches(8), Inches(1.5)
+            _IN_1, _IN_3, _IN_8, _IN_1_5
         )
         title_frame = title_box.text_frame
         title_frame.text = title
 
         p = title_frame.paragraphs[0]
         p.alignment = PP_ALIGN.CENTER
-        p.font.size = Pt(36)
+        p.font.size = _PT_36
         p.font.bold = True
 
         if brand_template:
-            r, g, b = self._hex_to_rgb(brand_template.colors.primary)
+            r, g, b = _hex_to_rgb(brand_template.colors.primary)
             p.font.color.rgb = RGBColor(r, g, b)
             self._apply_slide_background(slide, brand_template)
 
     def _finalize_content_slide(self, slide: Any, title: Optional[str],
                                 content: List, brand_template: Any = None):
         """Add title and content to a slide."""
-        from pptx.util import Pt, Inches
-        from pptx.enum.text import PP_ALIGN
+        palette = brand_template.colors if brand_template else None
 
         # Add title if provided
-        y_position = Inches(0.5)
+        y_position = _IN_0_5
         if title:
             title_box = slide.shapes.add_textbox(
-                Inches(0.5), y_position, Inches(9), Inches(0.75)
+                _IN_0_5, y_position, _IN_9, _IN_0_75
             )
             title_frame = title_box.text_frame
             title_frame.text = title
 
             p = title_frame.paragraphs[0]
-            p.font.size = Pt(32)
+            p.font.size = _PT_32
             p.font.bold = True
 
             if brand_template:
-                r, g, b = self._hex_to_rgb(brand_template.colors.primary)
+                r, g, b = _hex_to_rgb(palette.primary)
                 p.font.color.rgb = RGBColor(r, g, b)
 
-            y_position = Inches(1.5)
+            y_position = _IN_1_5
 
         # Add content
         if content:
             content_box = slide.shapes.add_textbox(
-                Inches(0.75), y_position, Inches(8.5), Inches(5.5)
+                _IN_0_75, y_position, _IN_8_5, _IN_5_5
             )
             content_frame = content_box.text_frame
             content_frame.word_wrap = True
 
+            text_rgb = RGBColor(*_hex_to_rgb(palette.text)) if brand_template else None
             for i, (item_type, text) in enumerate(content):
                 if i > 0:
                     content_frame.add_paragraph()
@@ -313,11 +343,10 @@ class PptxGenerationSkill(Skill):
                 p = content_frame.paragraphs[-1]
                 p.text = text
                 p.level = 1 if item_type == 'sub' else 0
-                p.font.size = Pt(16 if item_type == 'sub' else 18)
+                p.font.size = _PT_16 if item_type == 'sub' else _PT_18
 
-                if brand_template:
-                    r, g, b = self._hex_to_rgb(brand_template.colors.text)
-                    p.font.color.rgb = RGBColor(r, g, b)
+                if text_rgb:
+                    p.font.color.rgb = text_rgb
 
         # Apply background
         if brand_template:
@@ -330,42 +359,38 @@ class PptxGenerationSkill(Skill):
             fill = background.fill
             fill.solid()
 
-            r, g, b = self._hex_to_rgb(brand_template.colors.background)
+            r, g, b = _hex_to_rgb(brand_template.colors.background)
             fill.fore_color.rgb = RGBColor(r, g, b)
         except Exception as e:
             self.logger.warning(f"Could not apply slide background: {e}")
 
-    def _hex_to_rgb(self, hex_color: str) -> tuple:
-        """Convert hex color to RGB tuple."""
-        hex_color = hex_color.lstrip('#')
-        return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
-
     def _generate_mock_pptx(self, draft: DraftContent, **kwargs) -> Dict[str, Any]:
         """
         Generate a mock PPTX file when python-pptx is not available.
         Creates a simple text file with .pptx extension for development.
         """
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"{draft.content_type.value}_{timestamp}.pptx"
+        now = datetime.now()
+        timestamp = now.strftime("%Y%m%d_%H%M%S")
+        filename = kwargs.get("filename") or f"{draft.content_type.value}_{timestamp}.pptx"
         file_path = os.path.join(self.output_dir, filename)
 
         brand_template = kwargs.get("brand_template")
 
         # Create a simple text representation
-        content = f"""PPTX Presentation (Mock)
+        parts = [f"""PPTX Presentation (Mock)
 {'=' * 50}
 
 Content Type: {draft.content_type.value}
 Word Count: {draft.word_count}
-Created: {datetime.now().isoformat()}
-"""
+Created: {now.isoformat()}
+"""]
 
         if brand_template:
-            content += f"""Brand Template: {brand_template.name}
+            parts.append(f"""Brand Template: {brand_template.name}
 Company: {brand_template.company_name}
-"""
+""")
 
-        content += f"""
+        parts.append(f"""
 {'=' * 50}
 
 SLIDES:
@@ -376,18 +401,19 @@ Slide 1: Title Slide
 {draft.content}
 
 Closing Slide: Thank You
-"""
+""")
 
         if brand_template:
-            content += f"- {brand_template.company_name}\n"
+            parts.append(f"- {brand_template.company_name}\n")
             if brand_template.website:
-                content += f"- {brand_template.website}\n"
+                parts.append(f"- {brand_template.website}\n")
 
-        content += f"""
+        parts.append(f"""
 {'=' * 50}
 Note: This is a mock PPTX file. Install python-pptx for real PPTX generation.
 pip install python-pptx
-"""
+""")
+        content = ''.join(parts)
 
         with open(file_path, 'w', encoding='utf-8') as f:
             f.write(content)
@@ -400,10 +426,49 @@ pip install python-pptx
             "metadata": {
                 "word_count": draft.word_count,
                 "mock": True,
-                "created_at": datetime.now().isoformat()
+                "created_at": now.isoformat()
             }
         }
 
+    def execute_batch(
+        self,
+        inputs: List[DraftContent],
+        max_workers: Optional[int] = None,
+        **kwargs
+    ) -> List[Dict[str, Any]]:
+        """
+        Generate PPTX presentations for several drafts in parallel.
+
+        Rendering is CPU-bound and shares no state between documents, so each
+        draft is rendered in its own worker process.
+
+        Args:
+            inputs: DraftContent objects to render
+            max_workers: Worker process count (default: os.cpu_count())
+            **kwargs: Same options as execute(), applied to every draft. A
+                filename is used as a stem: each draft gets an _<n> suffix
+
+        Returns:
+            List of execute() result dictionaries, in input order
+        """
+        if not inputs:
+            return []
+
+        # Distinct filenames so documents rendered in the same second (or
+        # sharing a caller-supplied filename) don't collide
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        stem, suffix = os.path.splitext(kwargs["filename"]) if kwargs.get("filename") else ("", "")
+        suffix = suffix or ".pptx"
+
+        jobs = []
+        for i, draft in enumerate(inputs, 1):
+            prefix = stem or f"{draft.content_type.value}_{timestamp}"
+            jobs.append((self.config, draft, {**kwargs, "filename": f"{prefix}_{i}{suffix}"}))
+
+        workers = min(max_workers or os.cpu_count() or 1, len(jobs))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(_render_pptx, jobs))
+
     def validate_requirements(self) -> tuple[bool, list[str]]:
         """Validate that required dependencies are available."""
         missing = []
@@ -414,3 +479,9 @@ pip install python-pptx
             missing.append("python-pptx")
 
         return len(missing) == 0, missing
+
+
+def _render_pptx(job: tuple) -> Dict[str, Any]:
+    """Render one document in a worker process (module-level so it pickles)."""
+    config, draft, kwargs = job
+    return PptxGenerationSkill(config).execute(draft, **kwargs)
@@ -1,5 +1,5 @@
 """Social Content Skill package."""
 
-from .social_content import SocialContentSkill
+from .social_content import PlatformSpec, SocialContentSkill
 
-__all__ = ['SocialContentSkill']
+__all__ = ['PlatformSpec', 'SocialContentSkill']
@@ -12,9 +12,138 @@ import sys
 import os
 sys.path.append(os.path.join(os.path.dirname(__file__), '../..'))
 
-from typing import Dict, List, Any, Optional
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, List, Any, Optional, Sequence, Tuple
 from agents.base.agent import Skill
-from agents.base.models import ContentBrief, Platform
+from agents.base.models import ContentBrief, Platform, Source
+
+
+@dataclass(frozen=True, slots=True)
+class PlatformSpec:
+    """Formatting constraints and conventions for one social platform."""
+    max_length: int
+    optimal_length: Tuple[int, int]
+    hashtag_count: Tuple[int, int]
+    hashtag_strategy: str
+    supports_threads: bool
+    supports_media: bool
+    tone: str
+    emoji_usage: str
+    line_breaks: str
+
+
+# Platform constraints, shared read-only by all skill instances
+_PLATFORM_SPECS = MappingProxyType({
+    "linkedin": PlatformSpec(
+        max_length=3000,
+        optimal_length=(150, 300),
+        hashtag_count=(3, 5),
+        hashtag_strategy="professional",
+        supports_threads=False,
+        supports_media=True,
+        tone="professional",
+        emoji_usage="moderate",
+        line_breaks="encouraged"
+    ),
+    "twitter": PlatformSpec(
+        max_length=280,
+        optimal_length=(150, 250),
+        hashtag_count=(1, 2),
+        hashtag_strategy="relevant",
+        supports_threads=True,
+        supports_media=True,
+        tone="conversational",
+        emoji_usage="moderate",
+        line_breaks="limited"
+    ),
+    "instagram": PlatformSpec(
+        max_length=2200,
+        optimal_length=(100, 500),
+        hashtag_count=(5, 15),
+        hashtag_strategy="discovery",
+        supports_threads=False,
+        supports_media=True,  # Required
+        tone="casual",
+        emoji_usage="high",
+        line_breaks="encouraged"
+    ),
+    "facebook": PlatformSpec(
+        max_length=63206,
+        optimal_length=(40, 250),
+        hashtag_count=(1, 3),
+        hashtag_strategy="minimal",
+        supports_threads=False,
+        supports_media=True,
+        tone="conversational",
+        emoji_usage="moderate",
+        line_breaks="moderate"
+    )
+})
+
+# Hook templates by hook type, shared read-only by all skill instances
+_HOOK_TEMPLATES = MappingProxyType({
+    "question": (
+        "Have you ever wondered {topic}?",
+        "What if {scenario}?",
+        "Are you ready to {action}?",
+        "Can you believe {fact}?"
+    ),
+    "statistic": (
+        "{number}% of {audience} {action}.",
+        "Did you know? {statistic}",
+        "Shocking: {statistic}",
+        "{number} out of {total} {fact}"
+    ),
+    "bold_statement": (
+        "Here's the truth: {statement}",
+        "Let's be honest: {statement}",
+        "{statement}. Period.",
+        "Unpopular opinion: {statement}"
+    ),
+    "story": (
+        "Let me tell you about {scenario}",
+        "Here's what happened: {story}",
+        "Picture this: {scenario}",
+        "A while back, {story}"
+    ),
+    "problem": (
+        "Struggling with {problem}?",
+        "Tired of {problem}?",
+        "{problem} is holding you back.",
+        "Here's why {problem} happens"
+    )
+})
+
+
+@lru_cache(maxsize=256)
+def _preview_meta(platform: str, character_count: int) -> Dict[str, Any]:
+    """
+    Build the length-dependent part of a post preview.
+
+    Everything except the preview text depends only on the platform and
+    the content length, so it is memoized across repeated renders.
+
+    Args:
+        platform: Lowercased platform name
+        character_count: Length of the post content
+
+    Returns:
+        Preview fields other than platform and preview text (do not mutate)
+    """
+    specs = _PLATFORM_SPECS.get(platform, _PLATFORM_SPECS["linkedin"])
+    optimal_min, optimal_max = specs.optimal_length
+
+    return {
+        "character_count": character_count,
+        "max_length": specs.max_length,
+        "within_limits": character_count <= specs.max_length,
+        "optimal_range": specs.optimal_length,
+        "is_optimal": optimal_min <= character_count <= optimal_max,
+        "has_media_requirement": platform == "instagram"
+    }
 
 
 class SocialContentSkill(Skill):
@@ -29,94 +158,42 @@ class SocialContentSkill(Skill):
     - Thread/carousel support
     """
 
-    def __init__(self, config: Optional[Dict[str, Any]] = None):
-        super().__init__("social-content", config)
-        self.platform_specs = self._initialize_platform_specs()
-        self.hook_templates = self._initialize_hooks()
-
-    def _initialize_platform_specs(self) -> Dict[str, Dict[str, Any]]:
-        """Define platform-specific specifications."""
-        return {
-            "linkedin": {
-                "max_length": 3000,
-                "optimal_length": (150, 300),
-                "hashtag_count": (3, 5),
-                "hashtag_strategy": "professional",
-                "supports_threads": False,
-                "supports_media": True,
-                "tone": "professional",
-                "emoji_usage": "moderate",
-                "line_breaks": "encouraged"
-            },
-            "twitter": {
-                "max_length": 280,
-                "optimal_length": (150, 250),
-                "hashtag_count": (1, 2),
-                "hashtag_strategy": "relevant",
-                "supports_threads": True,
-                "supports_media": True,
-                "tone": "conversational",
-                "emoji_usage": "moderate",
-                "line_breaks": "limited"
-            },
-            "instagram": {
-                "max_length": 2200,
-                "optimal_length": (100, 500),
-                "hashtag_count": (5, 15),
-                "hashtag_strategy": "discovery",
-                "supports_threads": False,
-                "supports_media": True,  # Required
-                "tone": "casual",
-                "emoji_usage": "high",
-                "line_breaks": "encouraged"
-            },
-            "facebook": {
-                "max_length": 63206,
-                "optimal_length": (40, 250),
-                "hashtag_count": (1, 3),
-                "hashtag_strategy": "minimal",
-                "supports_threads": False,
-                "supports_media": True,
-                "tone": "conversational",
-                "emoji_usage": "moderate",
-                "line_breaks": "moderate"
-            }
+    # Markers that a research fact carries a statistic worth leading with
+    _STAT_INDICATOR_RE = re.compile(r"%|million|billion|increased|doubled", re.IGNORECASE)
+
+    # Word separators dropped when joining a keyword into a hashtag
+    _HASHTAG_WORD_SPLIT_RE = re.compile(r"[\s-]+")
+
+    # Generic tags used to pad Instagram posts up to the minimum hashtag count
+    _INSTAGRAM_GENERIC = ("#ContentCreation", "#DigitalMarketing", "#Technology")
+
+    # Call-to-action line per platform
+    _CTA_BY_PLATFORM = {
+        "linkedin": "What's your experience with this? Share your thoughts in the comments. 💭",
+        "twitter": "Thoughts? 💬",
+        "instagram": "Double tap if you agree! ❤️ Drop a comment below 👇",
+        "facebook": "What do you think? Let us know in the comments!"
+    }
+
+    # Emoji per context, keyed by the platform's emoji usage level
+    _EMOJI_BY_USAGE = {
+        # Instagram - use emojis liberally
+        "high": {
+            "main": "✨",
+            "stat": "📊",
+            "idea": "💡",
+            "success": "🎯"
+        },
+        # LinkedIn, Twitter - use sparingly
+        "moderate": {
+            "stat": "📈"
         }
+    }
 
-    def _initialize_hooks(self) -> Dict[str, List[str]]:
-        """Define hook templates by platform."""
-        return {
-            "question": [
-                "Have you ever wondered {topic}?",
-                "What if {scenario}?",
-                "Are you ready to {action}?",
-                "Can you believe {fact}?"
-            ],
-            "statistic": [
-                "{number}% of {audience} {action}.",
-                "Did you know? {statistic}",
-                "Shocking: {statistic}",
-                "{number} out of {total} {fact}"
-            ],
-            "bold_statement": [
-                "Here's the truth: {statement}",
-                "Let's be honest: {statement}",
-                "{statement}. Period.",
-                "Unpopular opinion: {statement}"
-            ],
-            "story": [
-                "Let me tell you about {scenario}",
-                "Here's what happened: {story}",
-                "Picture this: {scenario}",
-                "A while back, {story}"
-            ],
-            "problem": [
-                "Struggling with {problem}?",
-                "Tired of {problem}?",
-                "{problem} is holding you back.",
-                "Here's why {problem} happens"
-            ]
-        }
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        super().__init__("social-content", config)
+        self.platform_specs = _PLATFORM_SPECS
+        self.hook_templates = _HOOK_TEMPLATES
 
     def execute(
         self,
@@ -149,7 +226,7 @@ class SocialContentSkill(Skill):
         specs = self.platform_specs[platform]
 
         # Generate based on format
-        if format_type == "thread" and specs["supports_threads"]:
+        if format_type == "thread" and specs.supports_threads:
             return self._generate_thread(content_brief, platform, specs, **kwargs)
         elif format_type == "carousel":
             return self._generate_carousel_content(content_brief, platform, specs, **kwargs)
@@ -160,42 +237,43 @@ class SocialContentSkill(Skill):
         self,
         brief: ContentBrief,
         platform: str,
-        specs: Dict[str, Any],
+        specs: PlatformSpec,
         **kwargs
     ) -> str:
         """Generate a single social media post."""
-        max_length = specs["max_length"]
-        optimal_min, optimal_max = specs["optimal_length"]
+        max_length = specs.max_length
+        optimal_min, optimal_max = specs.optimal_length
 
+        sources = self._research_sources(brief)
         post_parts = []
 
         # 1. Hook (most important - first line determines engagement)
-        hook = self._generate_hook(brief, platform, specs)
+        hook = self._generate_hook(brief, platform, specs, sources)
         post_parts.append(hook)
 
         # 2. Main content
         main_content = self._generate_main_content(brief, platform, specs)
-        post_parts.append(f"\n\n{main_content}")
+        post_parts.append(main_content)
 
         # 3. Supporting points or data
-        if brief.research_brief and brief.research_brief.sources:
-            supporting = self._generate_supporting_points(brief, platform, specs)
+        if sources:
+            supporting = self._generate_supporting_points(platform, sources)
             if supporting:
-                post_parts.append(f"\n\n{supporting}")
+                post_parts.append(supporting)
 
         # 4. Call to action
         include_cta = kwargs.get("include_cta", True)
         if include_cta:
             cta = self._generate_cta(brief, platform, specs)
-            post_parts.append(f"\n\n{cta}")
+            post_parts.append(cta)
 
         # 5. Hashtags
         hashtags = self._generate_hashtags(brief, platform, specs)
         if hashtags:
-            post_parts.append(f"\n\n{hashtags}")
+            post_parts.append(hashtags)
 
-        # Combine and check length
-        full_post = "".join(post_parts)
+        # Combine and check length (main content may be empty)
+        full_post = "\n\n".join(part for part in post_parts if part)
 
         # Trim if too long
         if len(full_post) > max_length:
@@ -211,14 +289,29 @@ class SocialContentSkill(Skill):
 
         return full_post
 
-    def _generate_hook(self, brief: ContentBrief, platform: str, specs: Dict[str, Any]) -> str:
+    @staticmethod
+    def _research_sources(brief: ContentBrief) -> Sequence[Source]:
+        """Get the brief's research sources, or an empty tuple if there are none."""
+        research_brief = brief.research_brief
+        if research_brief and research_brief.sources:
+            return research_brief.sources
+        return ()
+
+    def _generate_hook(
+        self,
+        brief: ContentBrief,
+        platform: str,
+        specs: PlatformSpec,
+        sources: Sequence[Source]
+    ) -> str:
         """Generate an engaging opening hook."""
         # Try to use research data for hooks
-        if brief.research_brief and brief.research_brief.sources:
+        if sources:
             # Look for statistics first
-            for source in brief.research_brief.sources:
+            stat_search = self._STAT_INDICATOR_RE.search
+            for source in sources:
                 for fact in source.key_facts:
-                    if any(indicator in fact for indicator in ['%', 'million', 'billion', 'increased', 'doubled']):
+                    if stat_search(fact):
                         # Found a statistic - use it
                         emoji = self._get_emoji(platform, specs, "stat")
                         return f"{emoji} {fact}"
@@ -239,51 +332,54 @@ class SocialContentSkill(Skill):
 
         return "Let's talk about something important."
 
-    def _generate_main_content(self, brief: ContentBrief, platform: str, specs: Dict[str, Any]) -> str:
+    def _generate_main_content(self, brief: ContentBrief, platform: str, specs: PlatformSpec) -> str:
         """Generate main content body."""
-        content_parts = []
-
         # Get key messages
         messages = brief.key_messages[1:4] if len(brief.key_messages) > 1 else brief.key_messages
 
-        if platform == "twitter":
-            # Twitter: Keep it concise
-            if messages:
-                content_parts.append(messages[0])
-        elif platform == "linkedin":
-            # LinkedIn: More detailed, professional
-            for message in messages[:2]:
-                content_parts.append(f"→ {message}")
-        elif platform == "instagram":
-            # Instagram: Storytelling, visual
-            if messages:
-                content_parts.append(messages[0])
-                if len(messages) > 1:
-                    content_parts.append(f"\n\n✨ {messages[1]}")
-        else:  # facebook
-            # Facebook: Conversational
-            for message in messages[:2]:
-                content_parts.append(message)
-
-        return "\n\n".join(content_parts) if content_parts else ""
-
-    def _generate_supporting_points(self, brief: ContentBrief, platform: str, specs: Dict[str, Any]) -> str:
+        formatter = self._MAIN_CONTENT_FORMATTERS.get(platform, self._format_facebook_main)
+        return formatter(messages)
+
+    @staticmethod
+    def _format_twitter_main(messages: List[str]) -> str:
+        """Twitter: Keep it concise."""
+        return messages[0] if messages else ""
+
+    @staticmethod
+    def _format_linkedin_main(messages: List[str]) -> str:
+        """LinkedIn: More detailed, professional."""
+        return "\n\n".join(f"→ {message}" for message in messages[:2])
+
+    @staticmethod
+    def _format_instagram_main(messages: List[str]) -> str:
+        """Instagram: Storytelling, visual."""
+        if not messages:
+            return ""
+        if len(messages) > 1:
+            return f"{messages[0]}\n\n\n\n✨ {messages[1]}"
+        return messages[0]
+
+    @staticmethod
+    def _format_facebook_main(messages: List[str]) -> str:
+        """Facebook: Conversational."""
+        return "\n\n".join(messages[:2])
+
+    # Main content formatter per platform, shared by all instances
+    _MAIN_CONTENT_FORMATTERS = {
+        "twitter": _format_twitter_main,
+        "linkedin": _format_linkedin_main,
+        "instagram": _format_instagram_main,
+        "facebook": _format_facebook_main
+    }
+
+    def _generate_supporting_points(self, platform: str, sources: Sequence[Source]) -> str:
         """Generate supporting points or data."""
         if platform == "twitter":
             # Twitter: Skip supporting points due to length
             return ""
 
-        if not brief.research_brief or not brief.research_brief.sources:
-            return ""
-
-        points = []
-
         # Get interesting facts
-        for source in brief.research_brief.sources[:2]:
-            if source.key_facts:
-                points.append(source.key_facts[0])
-                if len(points) >= 2:
-                    break
+        points = [source.key_facts[0] for source in sources[:2] if source.key_facts]
 
         if not points:
             return ""
@@ -300,100 +396,70 @@ class SocialContentSkill(Skill):
         else:
             return "\n".join(points)
 
-    def _generate_cta(self, brief: ContentBrief, platform: str, specs: Dict[str, Any]) -> str:
+    def _generate_cta(self, brief: ContentBrief, platform: str, specs: PlatformSpec) -> str:
         """Generate call-to-action."""
-        if platform == "linkedin":
-            return "What's your experience with this? Share your thoughts in the comments. 💭"
-        elif platform == "twitter":
-            return "Thoughts? 💬"
-        elif platform == "instagram":
-            return "Double tap if you agree! ❤️ Drop a comment below 👇"
-        elif platform == "facebook":
-            return "What do you think? Let us know in the comments!"
-        else:
-            return "Share your thoughts!"
+        return self._CTA_BY_PLATFORM.get(platform, "Share your thoughts!")
 
-    def _generate_hashtags(self, brief: ContentBrief, platform: str, specs: Dict[str, Any]) -> str:
+    def _generate_hashtags(self, brief: ContentBrief, platform: str, specs: PlatformSpec) -> str:
         """Generate platform-appropriate hashtags."""
         if not brief.seo_keywords:
             return ""
 
-        min_tags, max_tags = specs["hashtag_count"]
-
-        # Convert keywords to hashtags
-        hashtags = []
-        for keyword in brief.seo_keywords[:max_tags]:
-            # Clean and format
-            tag = keyword.replace(" ", "").replace("-", "")
-            # Title case for readability
-            tag = "".join(word.capitalize() for word in keyword.split())
-            hashtags.append(f"#{tag}")
+        min_tags, max_tags = specs.hashtag_count
 
-        # Limit to recommended count
-        hashtags = hashtags[:max_tags]
+        # Convert keywords to title-cased hashtags, limited to recommended count
+        split_words = self._HASHTAG_WORD_SPLIT_RE.split
+        hashtags = [
+            "#" + "".join(word.capitalize() for word in split_words(keyword) if word)
+            for keyword in brief.seo_keywords[:max_tags]
+        ]
 
         # Ensure minimum count
         if len(hashtags) < min_tags and platform == "instagram":
             # Add generic relevant tags for Instagram
-            generic_tags = ["#ContentCreation", "#DigitalMarketing", "#Technology"]
-            hashtags.extend(generic_tags[:min_tags - len(hashtags)])
+            hashtags.extend(self._INSTAGRAM_GENERIC[:min_tags - len(hashtags)])
 
         return " ".join(hashtags)
 
-    def _get_emoji(self, platform: str, specs: Dict[str, Any], context: str) -> str:
+    def _get_emoji(self, platform: str, specs: PlatformSpec, context: str) -> str:
         """Get appropriate emoji based on platform and context."""
-        emoji_usage = specs["emoji_usage"]
-
-        if emoji_usage == "high":
-            # Instagram - use emojis liberally
-            emoji_map = {
-                "main": "✨",
-                "stat": "📊",
-                "idea": "💡",
-                "success": "🎯"
-            }
-            return emoji_map.get(context, "")
-        elif emoji_usage == "moderate":
-            # LinkedIn, Twitter - use sparingly
-            if context == "stat":
-                return "📈"
-            return ""
-        else:
-            # Facebook or minimal usage
-            return ""
+        # Facebook or minimal usage has no table and gets no emoji
+        return self._EMOJI_BY_USAGE.get(specs.emoji_usage, {}).get(context, "")
 
     def _trim_to_length(self, post_parts: List[str], max_length: int) -> str:
         """Trim post to fit within max length."""
         # Start with essentials: hook + main content
-        essential = post_parts[0] + (post_parts[1] if len(post_parts) > 1 else "")
+        essential = "\n\n".join(part for part in post_parts[:2] if part)
 
         if len(essential) > max_length:
             # Trim essential content
             return essential[:max_length - 3] + "..."
 
-        # Add parts until we hit the limit
-        result = essential
+        # Add parts until we hit the limit, tracking length (including the
+        # blank-line separator) instead of building intermediate strings
+        kept = [essential]
+        running = len(essential)
         for part in post_parts[2:]:
-            if len(result + part) <= max_length:
-                result += part
-            else:
+            running += 2 + len(part)
+            if running > max_length:
                 break
+            kept.append(part)
 
-        return result
+        return "\n\n".join(kept)
 
     def _generate_thread(
         self,
         brief: ContentBrief,
         platform: str,
-        specs: Dict[str, Any],
+        specs: PlatformSpec,
         **kwargs
     ) -> str:
         """Generate a Twitter/X thread."""
-        max_length = specs["max_length"]
+        max_length = specs.max_length
         thread_parts = []
 
         # Tweet 1: Hook and main message
-        hook = self._generate_hook(brief, platform, specs)
+        hook = self._generate_hook(brief, platform, specs, self._research_sources(brief))
         thread_parts.append(f"1/ {hook}")
 
         # Tweets 2-N: Key messages
@@ -411,7 +477,7 @@ class SocialContentSkill(Skill):
         # Add hashtags to first tweet if space
         if brief.seo_keywords:
             hashtags = self._generate_hashtags(brief, platform, specs)
-            if len(thread_parts[0] + "\n\n" + hashtags) <= max_length:
+            if len(thread_parts[0]) + 2 + len(hashtags) <= max_length:
                 thread_parts[0] += f"\n\n{hashtags}"
 
         return "\n\n---\n\n".join(thread_parts)
@@ -420,10 +486,11 @@ class SocialContentSkill(Skill):
         self,
         brief: ContentBrief,
         platform: str,
-        specs: Dict[str, Any],
+        specs: PlatformSpec,
         **kwargs
     ) -> str:
         """Generate content for carousel/multi-image posts."""
+        sources = self._research_sources(brief)
         slides = []
 
         # Slide 1: Title/Hook
@@ -434,9 +501,8 @@ class SocialContentSkill(Skill):
             slides.append(f"[Slide {i}]\n{message}")
 
             # Add supporting fact if available
-            if brief.research_brief and brief.research_brief.sources:
-                source_idx = (i - 2) % len(brief.research_brief.sources)
-                source = brief.research_brief.sources[source_idx]
+            if sources:
+                source = sources[(i - 2) % len(sources)]
                 if source.key_facts:
                     fact_idx = (i - 2) % len(source.key_facts)
                     slides.append(f"\n\n{source.key_facts[fact_idx]}")
@@ -460,15 +526,8 @@ class SocialContentSkill(Skill):
         Returns:
             Dictionary with preview information
         """
-        specs = self.platform_specs.get(platform.lower(), self.platform_specs["linkedin"])
-
         return {
             "platform": platform,
-            "character_count": len(content),
-            "max_length": specs["max_length"],
-            "within_limits": len(content) <= specs["max_length"],
-            "optimal_range": specs["optimal_length"],
-            "is_optimal": specs["optimal_length"][0] <= len(content) <= specs["optimal_length"][1],
-            "has_media_requirement": platform.lower() == "instagram",
+            **_preview_meta(platform.lower(), len(content)),
             "preview": content[:200] + "..." if len(content) > 200 else content
         }
@@ -9,11 +9,88 @@ import sys
 import os
 sys.path.append(os.path.join(os.path.dirname(__file__), '../..'))
 
-from typing import Dict, List, Any, Optional
+import re
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, List, Any, Mapping, Optional, Sequence
 from datetime import datetime
+from urllib.parse import urlparse
 from agents.base.agent import Skill
 from agents.base.models import Source
 
+try:
+    from dateutil import parser as _dateutil_parser
+except ImportError:
+    _dateutil_parser = None
+
+
+# Content quality indicators, matched case-insensitively in a single pass.
+# Group names map to bit flags identifying which indicator family fired.
+_QUALITY_RE = re.compile(
+    r"(?P<cite>references|sources|citation)"
+    r"|(?P<data>[%$]|data|study|research)"
+    r"|(?P<bait>you won't believe|shocking|one weird trick|doctors hate)",
+    re.IGNORECASE
+)
+_CITE_FLAG = 1
+_DATA_FLAG = 2
+_BAIT_FLAG = 4
+_ALL_FLAGS = _CITE_FLAG | _DATA_FLAG | _BAIT_FLAG
+_QUALITY_FLAGS = {"cite": _CITE_FLAG, "data": _DATA_FLAG, "bait": _BAIT_FLAG}
+
+
+def _quality_flags(text: str) -> int:
+    """
+    Scan text once for content quality indicators.
+
+    Args:
+        text: Text to scan
+
+    Returns:
+        Bitmask of the indicator families found
+    """
+    flags = 0
+    for match in _QUALITY_RE.finditer(text):
+        flags |= _QUALITY_FLAGS[match.lastgroup]
+        if flags == _ALL_FLAGS:
+            break
+    return flags
+
+
+# Batches at least this large that carry full content are scored in worker
+# processes; regex and date parsing hold the GIL, so threads don't scale there
+_PROCESS_BATCH_THRESHOLD = 256
+
+# Quoted passages long enough to be worth citing
+_QUOTE_RE = re.compile(r'"([^"]{20,200})"')
+
+# Recency score by age: up to 30 days, 6 months, 1, 2 and 3 years, then older
+_AGE_THRESHOLDS = (30, 180, 365, 730, 1095)
+_AGE_SCORES = (1.0, 0.9, 0.8, 0.7, 0.6, 0.5)
+
+
+@lru_cache(maxsize=4096)
+def _parse_domain(url: str) -> str:
+    """
+    Extract the normalized domain from a URL.
+
+    The same URL is typically scored, categorized and summarized, so the
+    parse is memoized.
+
+    Args:
+        url: Source URL
+
+    Returns:
+        Lowercased host name (no userinfo or port) with any leading "www."
+        removed; empty if the URL has no host
+
+    Raises:
+        ValueError: If the URL cannot be parsed
+    """
+    return (urlparse(url).hostname or "").removeprefix("www.")
+
 
 class SourceEvalSkill(Skill):
     """
@@ -28,8 +105,25 @@ class SourceEvalSkill(Skill):
 
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         super().__init__("source-eval", config)
-        self.trusted_domains = self._load_trusted_domains()
+        # Read-only: the suffix trie below is built from it once, and worker
+        # processes in evaluate_batch rebuild the skill from config, so
+        # in-place changes would silently be ignored. Override
+        # _load_trusted_domains to customize the list.
+        self.trusted_domains = MappingProxyType(self._load_trusted_domains())
         self.domain_categories = self._load_domain_categories()
+        self._trust_suffix = self._build_suffix_trie(self.trusted_domains)
+
+        # Flatten categories: exact domains map to a category directly, while
+        # entries starting with "." are top-level suffix rules
+        self._category_by_domain: Dict[str, str] = {}
+        suffix_rules = []
+        for category, domains in self.domain_categories.items():
+            for cat_domain in domains:
+                if cat_domain.startswith("."):
+                    suffix_rules.append((cat_domain, category))
+                else:
+                    self._category_by_domain.setdefault(cat_domain, category)
+        self._category_suffix_rules = tuple(suffix_rules)
 
     def _load_trusted_domains(self) -> Dict[str, float]:
         """
@@ -74,6 +168,29 @@ class SourceEvalSkill(Skill):
             "medium.com": 0.5,  # Varies widely by author
         }
 
+    @staticmethod
+    def _build_suffix_trie(domains: Mapping[str, float]) -> Dict[Optional[str], Any]:
+        """
+        Index domain scores by reversed labels for suffix lookups.
+
+        "nature.com" is stored under ["com"]["nature"], with its score at the
+        None key of the leaf, so subdomain matching only follows label
+        boundaries.
+
+        Args:
+            domains: Mapping of domains to scores
+
+        Returns:
+            Nested dictionary keyed on reversed domain labels
+        """
+        trie: Dict[Optional[str], Any] = {}
+        for domain, score in domains.items():
+            node = trie
+            for label in reversed(domain.split(".")):
+                node = node.setdefault(label, {})
+            node[None] = score
+        return trie
+
     def _load_domain_categories(self) -> Dict[str, List[str]]:
         """
         Load domain category classifications.
@@ -138,6 +255,39 @@ class SourceEvalSkill(Skill):
         self.logger.info(f"Source credibility score: {credibility_score:.2f}")
         return source
 
+    def evaluate_batch(
+        self,
+        sources: Sequence[Dict[str, Any]],
+        max_workers: int = 8
+    ) -> List[Source]:
+        """
+        Evaluate several sources.
+
+        Sources are independent, so they are dispatched to a thread pool
+        sharing this skill's domain tables. Large batches with full content
+        are CPU-bound and go to a process pool instead.
+
+        Args:
+            sources: Keyword arguments for execute (url, title, snippet, ...) per source
+            max_workers: Maximum number of workers
+
+        Returns:
+            Source objects, in the same order as the inputs
+        """
+        if not sources:
+            return []
+
+        self.logger.info(f"Evaluating batch of {len(sources)} sources")
+
+        workers = min(max_workers, len(sources))
+        if len(sources) >= _PROCESS_BATCH_THRESHOLD and any(source.get("full_content") for source in sources):
+            jobs = [(self.config, source) for source in sources]
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                return list(executor.map(_evaluate_source, jobs, chunksize=max(1, len(jobs) // (workers * 4))))
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(lambda source: self.execute(**source), sources))
+
     def _calculate_credibility(
         self,
         url: str,
@@ -159,38 +309,26 @@ class SourceEvalSkill(Skill):
         Returns:
             Credibility score (0.0 - 1.0)
         """
-        scores = []
-        weights = []
-
         # Domain credibility (weight: 0.4)
-        domain_score = self._score_domain(url)
-        scores.append(domain_score)
-        weights.append(0.4)
+        weighted_sum = self._score_domain(url) * 0.4
+        total_weight = 0.4
 
         # Recency score (weight: 0.2)
         if publication_date:
-            recency_score = self._score_recency(publication_date)
-            scores.append(recency_score)
-            weights.append(0.2)
+            weighted_sum += self._score_recency(publication_date) * 0.2
+            total_weight += 0.2
 
         # Author presence (weight: 0.1)
         if author:
-            scores.append(0.8)
-            weights.append(0.1)
+            weighted_sum += 0.8 * 0.1
+            total_weight += 0.1
 
         # Content quality indicators (weight: 0.3)
         if content:
-            quality_score = self._score_content_quality(content, title)
-            scores.append(quality_score)
-            weights.append(0.3)
+            weighted_sum += self._score_content_quality(content, title) * 0.3
+            total_weight += 0.3
 
         # Calculate weighted average
-        if not scores:
-            return 0.5  # Default neutral score
-
-        total_weight = sum(weights)
-        weighted_sum = sum(score * weight for score, weight in zip(scores, weights))
-
         return weighted_sum / total_weight
 
     def _score_domain(self, url: str) -> float:
@@ -203,15 +341,8 @@ class SourceEvalSkill(Skill):
         Returns:
             Domain credibility score (0.0 - 1.0)
         """
-        from urllib.parse import urlparse
-
         try:
-            parsed = urlparse(url)
-            domain = parsed.netloc.lower()
-
-            # Remove www. prefix
-            if domain.startswith("www."):
-                domain = domain[4:]
+            domain = _parse_domain(url)
 
             # Check exact domain match
             if domain in self.trusted_domains:
@@ -223,10 +354,16 @@ class SourceEvalSkill(Skill):
             if domain.endswith(".edu"):
                 return self.trusted_domains.get("edu", 0.85)
 
-            # Check for partial matches (e.g., subdomains)
-            for trusted_domain, score in self.trusted_domains.items():
-                if trusted_domain in domain:
-                    return score * 0.9  # Slight penalty for subdomain
+            # Check for subdomains of a trusted domain (deepest suffix wins)
+            node = self._trust_suffix
+            suffix_score = None
+            for label in reversed(domain.split(".")):
+                node = node.get(label)
+                if node is None:
+                    break
+                suffix_score = node.get(None, suffix_score)
+            if suffix_score is not None:
+                return suffix_score * 0.9  # Slight penalty for subdomain
 
             # Unknown domain - neutral score
             return 0.5
@@ -245,26 +382,17 @@ class SourceEvalSkill(Skill):
             Recency score (0.0 - 1.0)
         """
         try:
-            # Try to parse date (supports ISO format and common formats)
-            from dateutil import parser
-            pub_date = parser.parse(publication_date)
+            # ISO 8601 is the common case; fall back to dateutil for other formats
+            try:
+                pub_date = datetime.fromisoformat(publication_date.replace("Z", "+00:00"))
+            except ValueError:
+                pub_date = _dateutil_parser.parse(publication_date)
 
             # Calculate age in days
             age_days = (datetime.now() - pub_date).days
 
             # Scoring by age
-            if age_days <= 30:
-                return 1.0
-            elif age_days <= 180:
-                return 0.9
-            elif age_days <= 365:
-                return 0.8
-            elif age_days <= 730:  # 2 years
-                return 0.7
-            elif age_days <= 1095:  # 3 years
-                return 0.6
-            else:
-                return 0.5
+            return _AGE_SCORES[bisect_left(_AGE_THRESHOLDS, age_days)]
 
         except Exception:
             # If date parsing fails, return neutral score
@@ -292,17 +420,21 @@ class SourceEvalSkill(Skill):
         if len(content) > 2000:
             score += 0.1
 
+        # Clickbait counts in the title as well as the body
+        flags = _quality_flags(content)
+        if not flags & _BAIT_FLAG:
+            flags |= _quality_flags(title) & _BAIT_FLAG
+
         # Has citations or references
-        if any(indicator in content.lower() for indicator in ["references", "sources", "citation"]):
+        if flags & _CITE_FLAG:
             score += 0.1
 
         # Has data or statistics
-        if any(char in content for char in ["%", "$"]) or any(word in content.lower() for word in ["data", "study", "research"]):
+        if flags & _DATA_FLAG:
             score += 0.1
 
         # Avoid clickbait indicators
-        clickbait_indicators = ["you won't believe", "shocking", "one weird trick", "doctors hate"]
-        if any(indicator in (content + title).lower() for indicator in clickbait_indicators):
+        if flags & _BAIT_FLAG:
             score -= 0.2
 
         return min(1.0, max(0.0, score))
@@ -320,9 +452,7 @@ class SourceEvalSkill(Skill):
         """
         # Simple implementation - just use snippet for now
         # In production, this would use NLP to extract facts
-        if snippet:
-            return [snippet]
-        return []
+        return [snippet] if snippet else []
 
     def _extract_key_quotes(self, content: str, max_quotes: int = 3) -> List[str]:
         """
@@ -338,10 +468,8 @@ class SourceEvalSkill(Skill):
         if not content:
             return []
 
-        import re
-
         # Find text in quotes
-        quoted_text = re.findall(r'"([^"]{20,200})"', content)
+        quoted_text = _QUOTE_RE.findall(content)
 
         # Return up to max_quotes
         return quoted_text[:max_quotes]
@@ -356,20 +484,21 @@ class SourceEvalSkill(Skill):
         Returns:
             Source category (academic, news, industry, etc.)
         """
-        from urllib.parse import urlparse
-
         try:
-            parsed = urlparse(url)
-            domain = parsed.netloc.lower()
+            domain = _parse_domain(url)
 
-            if domain.startswith("www."):
-                domain = domain[4:]
+            # Check the domain and each parent domain against known sites
+            suffix = domain
+            while suffix:
+                category = self._category_by_domain.get(suffix)
+                if category:
+                    return category
+                suffix = suffix.partition(".")[2]
 
-            # Check categories
-            for category, domains in self.domain_categories.items():
-                for cat_domain in domains:
-                    if cat_domain in domain:
-                        return category
+            # Check top-level suffixes (e.g., .gov)
+            for cat_suffix, category in self._category_suffix_rules:
+                if domain.endswith(cat_suffix):
+                    return category
 
             return "general"
 
@@ -378,12 +507,13 @@ class SourceEvalSkill(Skill):
 
     def _extract_domain(self, url: str) -> str:
         """Extract domain from URL."""
-        from urllib.parse import urlparse
         try:
-            parsed = urlparse(url)
-            domain = parsed.netloc
-            if domain.startswith("www."):
-                domain = domain[4:]
-            return domain
+            return _parse_domain(url)
         except:
             return ""
+
+
+def _evaluate_source(job: tuple) -> Source:
+    """Evaluate one source in a worker process (module-level so it pickles)."""
+    config, source = job
+    return SourceEvalSkill(config).execute(**source)
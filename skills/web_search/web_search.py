@@ -21,17 +21,124 @@ Usage:
 import asyncio
 import logging
 import os
+import re
 import sys
 from datetime import datetime
-from typing import Any, Dict, List, Optional
-from urllib.parse import urlparse
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
 sys.path.append(os.path.join(os.path.dirname(__file__), "../.."))
 
 from agents.base.agent import Skill
 
+if TYPE_CHECKING:
+    from core.search.base import SearchResult
+
+try:
+    from core.search import MockSearchProvider, configure_search, get_search_provider
+    _HAS_SEARCH_CORE = True
+except ImportError:
+    _HAS_SEARCH_CORE = False
+
+try:
+    from stringzilla import Str as _SzStr
+    STRINGZILLA_AVAILABLE = True
+except ImportError:
+    STRINGZILLA_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Host part of an absolute URL: scheme, optional userinfo, then the host
+# (bracketed IPv6 or a plain name) up to the port, path, query or fragment
+_HOST_RE = re.compile(r"^[a-zA-Z][a-zA-Z0-9+.-]*://(?:[^/@]*@)?(\[[^\]/]*\]|[^/:?#\[]+)")
+
+# Trailing site-name segment such as " - Reuters" or " | TechCrunch"; the
+# separator must be surrounded by whitespace so hyphenated words are kept
+_TITLE_SITE_SUFFIX_RE = re.compile(r"\s+[-|\u2013\u2014]\s+[^-|\u2013\u2014]+$")
+
+
+def _title_key(title_lower: str) -> str:
+    """
+    Normalize a title for duplicate detection.
+
+    Whitespace runs are collapsed and a trailing site name is dropped, so
+    mirrored headlines such as "AI in 2025 - Reuters" and "AI in  2025 | Yahoo"
+    collide. Other punctuation is significant ("C++" vs "C#").
+
+    Args:
+        title_lower: Lowercased result title
+
+    Returns:
+        Normalized comparison key
+    """
+    return _TITLE_SITE_SUFFIX_RE.sub("", " ".join(title_lower.split()))
+
+
+# Query hints appended for each requested content type
+_CONTENT_TYPE_HINTS = {
+    "technical": "technical guide implementation",
+    "business": "business strategy ROI",
+    "academic": "research study peer-reviewed",
+    "news": "news latest update",
+}
+
+
+def _as_list(value: Any) -> Tuple[Any, ...]:
+    """
+    Normalize a term requirement to a sequence of terms.
+
+    Args:
+        value: A single term, a list/tuple of terms, or a falsy value
+
+    Returns:
+        Tuple of terms (empty for falsy values)
+    """
+    if not value:
+        return ()
+    if isinstance(value, str):
+        return (value,)
+    return tuple(value)
+
+
+@lru_cache(maxsize=4096)
+def _optimize_query_cached(
+    base_query: str, req_key: Tuple[Tuple[str, Any], ...], current_year: int
+) -> str:
+    """
+    Build an optimized query (memoized; see WebSearchSkill.optimize_query).
+
+    Args:
+        base_query: Base search query
+        req_key: Sorted requirement items, with list values as tuples
+        current_year: Year appended for recent_only requirements
+
+    Returns:
+        Optimized query string
+    """
+    requirements = dict(req_key)
+    parts = [base_query]
+
+    # Add time constraints
+    if requirements.get("recent_only"):
+        parts.append(str(current_year))
+    elif requirements.get("year"):
+        parts.append(str(requirements["year"]))
+
+    # Add domain restrictions (for query, not API filter)
+    if requirements.get("site"):
+        parts.append(f"site:{requirements['site']}")
+
+    # Add content type hints
+    content_type = requirements.get("content_type")
+    if content_type:
+        parts.append(_CONTENT_TYPE_HINTS.get(content_type, content_type))
+
+    # Add must-include terms and exclusions
+    parts.extend(f'"{term}"' for term in _as_list(requirements.get("must_include")))
+    parts.extend(f'-"{term}"' for term in _as_list(requirements.get("exclude")))
+
+    return " ".join(parts).strip()
+
 
 class WebSearchSkill(Skill):
     """
@@ -52,6 +159,7 @@ class WebSearchSkill(Skill):
             "enable_filtering": True,       # Enable relevance filtering
             "search_depth": "basic",        # basic or advanced
             "include_raw_content": False,   # Include full page content
+            "max_concurrency": 5,           # Parallel provider calls per batch
         }
     """
 
@@ -64,6 +172,7 @@ class WebSearchSkill(Skill):
         self.provider_name = config.get("provider")
         self.search_depth = config.get("search_depth", "basic")
         self.include_raw_content = config.get("include_raw_content", False)
+        self.max_concurrency = config.get("max_concurrency", 5)
 
         # Search provider will be initialized lazily
         self._search_provider = None
@@ -71,27 +180,19 @@ class WebSearchSkill(Skill):
     def _get_search_provider(self):
         """Get or initialize the search provider."""
         if self._search_provider is None:
-            try:
-                from core.search import get_search_provider, configure_search
-
-                # Configure search from environment if not already done
-                configure_search(provider=self.provider_name)
-                self._search_provider = get_search_provider(self.provider_name)
-
-                if self._search_provider:
-                    self.logger.info(
-                        f"Using search provider: {self._search_provider.name}"
-                    )
-                else:
-                    self.logger.warning("No search provider available, using mock")
-                    from core.search.base import MockSearchProvider
+            if not _HAS_SEARCH_CORE:
+                raise ImportError("Search providers not available: core.search could not be imported")
 
-                    self._search_provider = MockSearchProvider()
-
-            except ImportError as e:
-                self.logger.warning(f"Search providers not available: {e}")
-                from core.search.base import MockSearchProvider
+            # Configure search from environment if not already done
+            configure_search(provider=self.provider_name)
+            self._search_provider = get_search_provider(self.provider_name)
 
+            if self._search_provider:
+                self.logger.info(
+                    f"Using search provider: {self._search_provider.name}"
+                )
+            else:
+                self.logger.warning("No search provider available, using mock")
                 self._search_provider = MockSearchProvider()
 
         return self._search_provider
@@ -118,6 +219,34 @@ class WebSearchSkill(Skill):
             List of search result dictionaries
         """
         max_results = max_results or self.max_results
+        results = await self._raw_search_async(query, max_results, **kwargs)
+
+        results, titles_lower, relevance = self._filter_for_query(results, query)
+
+        # Deduplicate
+        keep = self._unique_indices([result.url for result in results], titles_lower)
+
+        self.logger.info(f"Returning {len(keep)} filtered results")
+
+        return self._to_dicts(results, relevance, keep[:max_results])
+
+    async def _raw_search_async(
+        self,
+        query: str,
+        max_results: int,
+        **kwargs,
+    ) -> List["SearchResult"]:
+        """
+        Run a provider search without filtering or deduplication.
+
+        Args:
+            query: Search query string
+            max_results: Maximum number of results to request from the provider
+            **kwargs: Additional search parameters (see execute_async)
+
+        Returns:
+            Provider SearchResult objects (empty if the search failed)
+        """
         provider = self._get_search_provider()
 
         self.logger.info(f"Executing web search: {query}")
@@ -134,12 +263,9 @@ class WebSearchSkill(Skill):
             include_raw_content=kwargs.get("include_raw_content", self.include_raw_content),
         )
 
-        # Execute search
+        # Execute search (results stay SearchResult objects until returned)
         try:
-            search_results = await provider.search(query, search_config)
-
-            # Convert to dictionaries
-            results = [result.to_dict() for result in search_results]
+            results = list(await provider.search(query, search_config))
 
             self.logger.info(f"Search returned {len(results)} results")
 
@@ -147,16 +273,39 @@ class WebSearchSkill(Skill):
             self.logger.error(f"Search failed: {e}")
             results = []
 
-        # Apply additional filtering if enabled
-        if self.enable_filtering and results:
-            results = self._filter_results(results, query)
+        return results
 
-        # Deduplicate
-        results = self._deduplicate_results(results)
+    def _filter_for_query(
+        self, results: List["SearchResult"], query: str
+    ) -> Tuple[List["SearchResult"], List[str], List[Optional[float]]]:
+        """
+        Apply relevance filtering (if enabled) for one query's results.
 
-        self.logger.info(f"Returning {len(results)} filtered results")
+        Args:
+            results: Provider search results
+            query: Query the results were returned for
 
-        return results[:max_results]
+        Returns:
+            Tuple of (kept results, their lowercased titles, their relevance
+            scores or None when filtering is disabled), in ranked order
+        """
+        # Lowercase titles once; filtering and deduplication both read them
+        titles_lower = [result.title.lower() for result in results]
+        relevance = [None] * len(results)
+
+        # Apply additional filtering if enabled
+        if self.enable_filtering and results:
+            order, scores = self._rank_results(
+                query,
+                titles_lower,
+                [result.content for result in results],
+                [result.score for result in results],
+            )
+            results = [results[i] for i in order]
+            titles_lower = [titles_lower[i] for i in order]
+            relevance = [scores[i] for i in order]
+
+        return results, titles_lower, relevance
 
     def execute(
         self,
@@ -177,6 +326,31 @@ class WebSearchSkill(Skill):
         """
         return asyncio.run(self.execute_async(query, max_results, **kwargs))
 
+    @staticmethod
+    def _to_dicts(
+        results: List["SearchResult"],
+        relevance: List[Optional[float]],
+        indices: List[int],
+    ) -> List[Dict[str, Any]]:
+        """
+        Convert the selected results to output dictionaries.
+
+        Args:
+            results: Provider search results
+            relevance: Relevance score per result (None if unscored)
+            indices: Positions of the results to return, in order
+
+        Returns:
+            List of search result dictionaries
+        """
+        output = []
+        for i in indices:
+            result = results[i].to_dict()
+            if relevance[i] is not None:
+                result["_relevance_score"] = relevance[i]
+            output.append(result)
+        return output
+
     def _filter_results(
         self, results: List[Dict[str, Any]], query: str
     ) -> List[Dict[str, Any]]:
@@ -190,29 +364,66 @@ class WebSearchSkill(Skill):
         Returns:
             Filtered results
         """
-        filtered = []
-        query_terms = set(query.lower().split())
+        order, relevance = self._rank_results(
+            query,
+            [result.get("title", "").lower() for result in results],
+            [result.get("content", "") for result in results],
+            [result.get("score", 0) for result in results],
+        )
 
-        for result in results:
-            title = result.get("title", "").lower()
-            content = result.get("content", "").lower()
+        for i in order:
+            results[i]["_relevance_score"] = relevance[i]
 
-            # Count query term matches
-            title_matches = sum(1 for term in query_terms if term in title)
-            content_matches = sum(1 for term in query_terms if term in content)
+        return [results[i] for i in order]
+
+    def _rank_results(
+        self,
+        query: str,
+        titles_lower: List[str],
+        contents: List[str],
+        provider_scores: List[float],
+    ) -> Tuple[List[int], Dict[int, float]]:
+        """
+        Score results for relevance and rank the ones worth keeping.
+
+        Takes the result fields as parallel lists so callers can pass either
+        dictionaries or SearchResult objects.
+
+        Args:
+            query: Original query
+            titles_lower: Lowercased titles
+            contents: Content snippets
+            provider_scores: Provider relevance scores
+
+        Returns:
+            Tuple of (indices of kept results, most relevant first; relevance
+            score by index)
+        """
+        kept = []
+        relevance = {}
+        query_terms = tuple(set(query.lower().split()))
+
+        for i, (title, content, provider_score) in enumerate(
+            zip(titles_lower, contents, provider_scores)
+        ):
+            content = content.lower()
+            if STRINGZILLA_AVAILABLE:
+                # SIMD substring search; only worth wrapping the long field
+                content = _SzStr(content)
+
+            # Count query term matches (map keeps the containment loop in C)
+            title_matches = sum(map(title.__contains__, query_terms))
+            content_matches = sum(map(content.__contains__, query_terms))
 
             # Require at least some matches (or high provider score)
-            provider_score = result.get("score", 0)
             if title_matches > 0 or content_matches > 1 or provider_score > 0.7:
-                result["_relevance_score"] = (
-                    title_matches * 2 + content_matches + provider_score * 5
-                )
-                filtered.append(result)
+                relevance[i] = title_matches * 2 + content_matches + provider_score * 5
+                kept.append(i)
 
         # Sort by relevance
-        filtered.sort(key=lambda x: x.get("_relevance_score", 0), reverse=True)
+        kept.sort(key=relevance.__getitem__, reverse=True)
 
-        return filtered
+        return kept, relevance
 
     def _deduplicate_results(
         self, results: List[Dict[str, Any]]
@@ -226,13 +437,33 @@ class WebSearchSkill(Skill):
         Returns:
             Deduplicated results
         """
+        keep = self._unique_indices(
+            [result.get("url", "") for result in results],
+            [result.get("title", "").lower() for result in results],
+        )
+        return [results[i] for i in keep]
+
+    @staticmethod
+    def _unique_indices(urls: List[str], titles_lower: List[str]) -> List[int]:
+        """
+        Find the first occurrence of each distinct result.
+
+        Titles are compared by a normalized key in a set, so detection stays
+        linear in the number of results.
+
+        Args:
+            urls: Result URLs
+            titles_lower: Lowercased result titles, parallel to urls
+
+        Returns:
+            Indices of results that are neither URL nor title duplicates
+        """
         seen_urls = set()
         seen_titles = set()
-        deduplicated = []
+        keep = []
 
-        for result in results:
-            url = result.get("url", "")
-            title = result.get("title", "").lower()
+        for i, (url, title_lower) in enumerate(zip(urls, titles_lower)):
+            title = _title_key(title_lower)
 
             # Skip if we've seen this URL
             if url in seen_urls:
@@ -244,9 +475,9 @@ class WebSearchSkill(Skill):
 
             seen_urls.add(url)
             seen_titles.add(title)
-            deduplicated.append(result)
+            keep.append(i)
 
-        return deduplicated
+        return keep
 
     def optimize_query(self, base_query: str, requirements: Dict[str, Any]) -> str:
         """
@@ -259,43 +490,19 @@ class WebSearchSkill(Skill):
         Returns:
             Optimized query string
         """
-        query = base_query
-
-        # Add time constraints
-        if requirements.get("recent_only"):
-            current_year = datetime.now().year
-            query += f" {current_year}"
-        elif requirements.get("year"):
-            query += f" {requirements['year']}"
-
-        # Add domain restrictions (for query, not API filter)
-        if requirements.get("site"):
-            query += f" site:{requirements['site']}"
-
-        # Add content type hints
-        content_type = requirements.get("content_type")
-        if content_type:
-            type_hints = {
-                "technical": "technical guide implementation",
-                "business": "business strategy ROI",
-                "academic": "research study peer-reviewed",
-                "news": "news latest update",
-            }
-            query += " " + type_hints.get(content_type, content_type)
+        # Only recent_only queries depend on the clock; reading it lazily
+        # also keeps cached queries correct across a year boundary
+        current_year = datetime.now().year if requirements.get("recent_only") else 0
+        req_key = tuple(sorted(
+            (key, tuple(value) if isinstance(value, list) else value)
+            for key, value in requirements.items()
+        ))
 
-        # Add must-include terms
-        if requirements.get("must_include"):
-            must_terms = requirements["must_include"]
-            if isinstance(must_terms, list):
-                query += " " + " ".join(f'"{term}"' for term in must_terms)
-
-        # Add exclusions
-        if requirements.get("exclude"):
-            exclude_terms = requirements["exclude"]
-            if isinstance(exclude_terms, list):
-                query += " " + " ".join(f'-"{term}"' for term in exclude_terms)
-
-        return query.strip()
+        try:
+            return _optimize_query_cached(base_query, req_key, current_year)
+        except TypeError:
+            # Unhashable requirement values can't be cached
+            return _optimize_query_cached.__wrapped__(base_query, req_key, current_year)
 
     def parse_search_result(self, raw_result: Any) -> Dict[str, Any]:
         """
@@ -310,12 +517,12 @@ class WebSearchSkill(Skill):
         if isinstance(raw_result, dict):
             # Extract domain from URL
             url = raw_result.get("url", raw_result.get("link", ""))
-            try:
-                source = urlparse(url).netloc
-                if source.startswith("www."):
-                    source = source[4:]
-            except Exception:
-                source = raw_result.get("source", raw_result.get("domain"))
+            match = _HOST_RE.match(url)
+            if match:
+                # Domains repeat heavily across result sets; share one string each
+                source = sys.intern(match.group(1).lower().removeprefix("www."))
+            else:
+                source = raw_result.get("source", raw_result.get("domain")) or ""
 
             return {
                 "title": raw_result.get("title", ""),
@@ -349,22 +556,38 @@ class WebSearchSkill(Skill):
             Combined, deduplicated results
         """
         all_results = []
+        all_titles = []
+        all_relevance = []
 
-        # Execute searches concurrently
-        tasks = [
-            self.execute_async(query, max_results=max_results_per_query)
-            for query in queries
-        ]
-        results_lists = await asyncio.gather(*tasks, return_exceptions=True)
-
-        for results in results_lists:
-            if isinstance(results, list):
-                all_results.extend(results)
-            elif isinstance(results, Exception):
+        # Execute provider searches concurrently, bounded so a long query list
+        # doesn't trip the provider's rate limit. The semaphore is created per
+        # call because execute() runs each batch on a fresh event loop.
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def bounded_search(query: str) -> List["SearchResult"]:
+            async with semaphore:
+                return await self._raw_search_async(query, max_results=max_results_per_query)
+
+        results_lists = await asyncio.gather(
+            *(bounded_search(query) for query in queries), return_exceptions=True
+        )
+
+        # Filter and deduplicate each batch against its own query before
+        # truncating (as execute_async does), then deduplicate across queries
+        for query, results in zip(queries, results_lists):
+            if isinstance(results, Exception):
                 self.logger.warning(f"Search query failed: {results}")
+                continue
+
+            results, titles_lower, relevance = self._filter_for_query(results, query)
+            unique = self._unique_indices([result.url for result in results], titles_lower)
+            for i in unique[:max_results_per_query]:
+                all_results.append(results[i])
+                all_titles.append(titles_lower[i])
+                all_relevance.append(relevance[i])
 
-        # Deduplicate combined results
-        return self._deduplicate_results(all_results)
+        keep = self._unique_indices([result.url for result in all_results], all_titles)
+        return self._to_dicts(all_results, all_relevance, keep)
 
     async def get_full_content(self, url: str) -> Optional[str]:
         """
@@ -5,9 +5,20 @@ This module defines the brand's visual identity, voice, and style guidelines
 that are applied consistently across all produced content.
 """
 
-from typing import Dict, Any, List, Optional
-from dataclasses import dataclass, field
+import sys
+from collections.abc import Mapping
+from typing import Callable, Dict, Any, Iterator, List, Optional
+from dataclasses import dataclass, field, fields
 from enum import Enum
+from functools import lru_cache
+
+
+def _intern_str_fields(obj: Any) -> None:
+    """Intern the str fields of a frozen dataclass so repeated colors/fonts share one object."""
+    for f in fields(obj):
+        value = getattr(obj, f.name)
+        if type(value) is str:
+            object.__setattr__(obj, f.name, sys.intern(value))
 
 
 class ColorScheme(Enum):
@@ -19,7 +30,7 @@ class ColorScheme(Enum):
     TECH = "tech"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class BrandColors:
     """Brand color palette."""
     primary: str  # Hex color code
@@ -36,8 +47,11 @@ class BrandColors:
     error: str = "#DC3545"
     info: str = "#17A2B8"
 
+    def __post_init__(self):
+        _intern_str_fields(self)
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class BrandTypography:
     """Brand typography settings."""
     heading_font: str
@@ -55,8 +69,11 @@ class BrandTypography:
     heading_line_height: float = 1.2
     body_line_height: float = 1.5
 
+    def __post_init__(self):
+        _intern_str_fields(self)
+
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class BrandSpacing:
     """Brand spacing and layout settings."""
     page_margin_top: float = 1.0  # inches
@@ -71,7 +88,7 @@ class BrandSpacing:
     slide_padding: float = 0.5  # inches
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DocumentLayout:
     """Document-specific layout settings for DOCX and PDF output."""
     # Page dimensions
@@ -95,7 +112,7 @@ class DocumentLayout:
     paragraph_spacing_after: float = 6.0
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PresentationLayout:
     """Presentation-specific layout settings for PPTX output."""
     # Slide dimensions (16:9 aspect ratio standard)
@@ -119,7 +136,7 @@ class PresentationLayout:
     bullet_indent: float = 0.5  # inches
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class BrandLogo:
     """Brand logo information."""
     path: Optional[str] = None
@@ -128,7 +145,7 @@ class BrandLogo:
     position: str = "header"  # header, footer, corner
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class BrandTemplate:
     """
     Complete brand template configuration.
@@ -179,135 +196,184 @@ class BrandTemplate:
         }
 
 
-# Predefined brand templates
-
-PROFESSIONAL_TEMPLATE = BrandTemplate(
-    name="Professional",
-    colors=BrandColors(
-        primary="#2C3E50",      # Dark blue-gray
-        secondary="#34495E",    # Medium blue-gray
-        accent="#3498DB",       # Bright blue
-        text="#2C3E50",
-        text_light="#7F8C8D",
-        background="#FFFFFF",
-        background_alt="#ECF0F1"
-    ),
-    typography=BrandTypography(
-        heading_font="Calibri",
-        body_font="Calibri",
-        h1_size=24,
-        h2_size=18,
-        h3_size=14,
-        body_size=11
-    ),
-    company_name="Professional Corp",
-    color_scheme=ColorScheme.PROFESSIONAL
-)
-
-MODERN_TEMPLATE = BrandTemplate(
-    name="Modern",
-    colors=BrandColors(
-        primary="#1A1A1A",      # Almost black
-        secondary="#4A4A4A",    # Dark gray
-        accent="#FF6B6B",       # Coral red
-        text="#1A1A1A",
-        text_light="#6C6C6C",
-        background="#FFFFFF",
-        background_alt="#F8F8F8"
-    ),
-    typography=BrandTypography(
-        heading_font="Arial",
-        body_font="Arial",
-        h1_size=26,
-        h2_size=20,
-        h3_size=16,
-        body_size=11
-    ),
-    company_name="Modern Tech",
-    color_scheme=ColorScheme.MODERN
-)
-
-TECH_TEMPLATE = BrandTemplate(
-    name="Tech",
-    colors=BrandColors(
-        primary="#0A192F",      # Navy
-        secondary="#172A45",    # Dark blue
-        accent="#64FFDA",       # Teal
-        text="#0A192F",
-        text_light="#8892B0",
-        background="#FFFFFF",
-        background_alt="#F7FAFC"
-    ),
-    typography=BrandTypography(
-        heading_font="Arial",
-        body_font="Arial",
-        mono_font="Consolas",
-        h1_size=24,
-        h2_size=18,
-        h3_size=14,
-        body_size=11
-    ),
-    company_name="Tech Innovators",
-    color_scheme=ColorScheme.TECH
-)
-
-CREATIVE_TEMPLATE = BrandTemplate(
-    name="Creative",
-    colors=BrandColors(
-        primary="#6C5CE7",      # Purple
-        secondary="#A29BFE",    # Light purple
-        accent="#FD79A8",       # Pink
-        text="#2D3436",
-        text_light="#636E72",
-        background="#FFFFFF",
-        background_alt="#F8F9FA"
-    ),
-    typography=BrandTypography(
-        heading_font="Georgia",
-        body_font="Georgia",
-        h1_size=26,
-        h2_size=20,
-        h3_size=16,
-        body_size=11
-    ),
-    company_name="Creative Studio",
-    color_scheme=ColorScheme.CREATIVE
-)
-
-MINIMAL_TEMPLATE = BrandTemplate(
-    name="Minimal",
-    colors=BrandColors(
-        primary="#000000",      # Black
-        secondary="#333333",    # Dark gray
-        accent="#000000",       # Black (minimal accent)
-        text="#000000",
-        text_light="#666666",
-        background="#FFFFFF",
-        background_alt="#FAFAFA"
-    ),
-    typography=BrandTypography(
-        heading_font="Helvetica",
-        body_font="Helvetica",
-        h1_size=24,
-        h2_size=18,
-        h3_size=14,
-        body_size=11
-    ),
-    company_name="Minimal Co",
-    color_scheme=ColorScheme.MINIMAL
-)
+# Predefined brand templates (built on first use; each builder is cached so
+# every lookup of a name returns the same instance)
+
+@lru_cache(maxsize=None)
+def _build_professional() -> BrandTemplate:
+    return BrandTemplate(
+        name="Professional",
+        colors=BrandColors(
+            primary="#2C3E50",      # Dark blue-gray
+            secondary="#34495E",    # Medium blue-gray
+            accent="#3498DB",       # Bright blue
+            text="#2C3E50",
+            text_light="#7F8C8D",
+            background="#FFFFFF",
+            background_alt="#ECF0F1"
+        ),
+        typography=BrandTypography(
+            heading_font="Calibri",
+            body_font="Calibri",
+            h1_size=24,
+            h2_size=18,
+            h3_size=14,
+            body_size=11
+        ),
+        company_name="Professional Corp",
+        color_scheme=ColorScheme.PROFESSIONAL
+    )
+
+
+@lru_cache(maxsize=None)
+def _build_modern() -> BrandTemplate:
+    return BrandTemplate(
+        name="Modern",
+        colors=BrandColors(
+            primary="#1A1A1A",      # Almost black
+            secondary="#4A4A4A",    # Dark gray
+            accent="#FF6B6B",       # Coral red
+            text="#1A1A1A",
+            text_light="#6C6C6C",
+            background="#FFFFFF",
+            background_alt="#F8F8F8"
+        ),
+        typography=BrandTypography(
+            heading_font="Arial",
+            body_font="Arial",
+            h1_size=26,
+            h2_size=20,
+            h3_size=16,
+            body_size=11
+        ),
+        company_name="Modern Tech",
+        color_scheme=ColorScheme.MODERN
+    )
+
+
+@lru_cache(maxsize=None)
+def _build_tech() -> BrandTemplate:
+    return BrandTemplate(
+        name="Tech",
+        colors=BrandColors(
+            primary="#0A192F",      # Navy
+            secondary="#172A45",    # Dark blue
+            accent="#64FFDA",       # Teal
+            text="#0A192F",
+            text_light="#8892B0",
+            background="#FFFFFF",
+            background_alt="#F7FAFC"
+        ),
+        typography=BrandTypography(
+            heading_font="Arial",
+            body_font="Arial",
+            mono_font="Consolas",
+            h1_size=24,
+            h2_size=18,
+            h3_size=14,
+            body_size=11
+        ),
+        company_name="Tech Innovators",
+        color_scheme=ColorScheme.TECH
+    )
+
+
+@lru_cache(maxsize=None)
+def _build_creative() -> BrandTemplate:
+    return BrandTemplate(
+        name="Creative",
+        colors=BrandColors(
+            primary="#6C5CE7",      # Purple
+            secondary="#A29BFE",    # Light purple
+            accent="#FD79A8",       # Pink
+            text="#2D3436",
+            text_light="#636E72",
+            background="#FFFFFF",
+            background_alt="#F8F9FA"
+        ),
+        typography=BrandTypography(
+            heading_font="Georgia",
+            body_font="Georgia",
+            h1_size=26,
+            h2_size=20,
+            h3_size=16,
+            body_size=11
+        ),
+        company_name="Creative Studio",
+        color_scheme=ColorScheme.CREATIVE
+    )
+
+
+@lru_cache(maxsize=None)
+def _build_minimal() -> BrandTemplate:
+    return BrandTemplate(
+        name="Minimal",
+        colors=BrandColors(
+            primary="#000000",      # Black
+            secondary="#333333",    # Dark gray
+            accent="#000000",       # Black (minimal accent)
+            text="#000000",
+            text_light="#666666",
+            background="#FFFFFF",
+            background_alt="#FAFAFA"
+        ),
+        typography=BrandTypography(
+            heading_font="Helvetica",
+            body_font="Helvetica",
+            h1_size=24,
+            h2_size=18,
+            h3_size=14,
+            body_size=11
+        ),
+        company_name="Minimal Co",
+        color_scheme=ColorScheme.MINIMAL
+    )
+
+
+class _TemplateRegistry(Mapping):
+    """Read-only mapping of template names to lazily built BrandTemplates."""
+
+    def __init__(self, factories: Dict[str, Callable[[], BrandTemplate]]):
+        self._factories = factories
+
+    def __getitem__(self, name: str) -> BrandTemplate:
+        return self._factories[name]()
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._factories
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._factories)
+
+    def __len__(self) -> int:
+        return len(self._factories)
 
 
 # Template registry
-BRAND_TEMPLATES = {
-    "professional": PROFESSIONAL_TEMPLATE,
-    "modern": MODERN_TEMPLATE,
-    "tech": TECH_TEMPLATE,
-    "creative": CREATIVE_TEMPLATE,
-    "minimal": MINIMAL_TEMPLATE
+BRAND_TEMPLATES: Mapping = _TemplateRegistry({
+    "professional": _build_professional,
+    "modern": _build_modern,
+    "tech": _build_tech,
+    "creative": _build_creative,
+    "minimal": _build_minimal
+})
+
+# Module-level names for the predefined templates, resolved lazily
+_TEMPLATE_CONSTANTS = {
+    "PROFESSIONAL_TEMPLATE": "professional",
+    "MODERN_TEMPLATE": "modern",
+    "TECH_TEMPLATE": "tech",
+    "CREATIVE_TEMPLATE": "creative",
+    "MINIMAL_TEMPLATE": "minimal"
 }
 
 
+def __getattr__(name: str) -> BrandTemplate:
+    if name in _TEMPLATE_CONSTANTS:
+        return BRAND_TEMPLATES[_TEMPLATE_CONSTANTS[name]]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 def get_brand_template(name: str = "professional") -> BrandTemplate:
     """
     Get a brand template by name.
@@ -318,7 +384,10 @@ def get_brand_template(name: str = "professional") -> BrandTemplate:
     Returns:
         BrandTemplate instance
     """
-    return BRAND_TEMPLATES.get(name.lower(), PROFESSIONAL_TEMPLATE)
+    name = name.lower()
+    if name not in BRAND_TEMPLATES:
+        name = "professional"
+    return BRAND_TEMPLATES[name]
 
 
 def create_custom_template(
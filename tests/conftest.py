@@ -0,0 +1,21 @@
+"""Shared pytest fixtures for the test suite."""
+
+import pytest
+
+from tests.test_data import create_test_draft
+
+
+@pytest.fixture(scope="session")
+def draft():
+    """Test draft built once and shared across the session."""
+    return create_test_draft()
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--reuse-outputs",
+        action="store_true",
+        default=False,
+        help="Reuse documents generated by a previous run when the draft and "
+             "brand template are unchanged (skips regeneration)",
+    )
@@ -0,0 +1,54 @@
+"""Tests for batch PDF and PPTX generation."""
+
+import os
+
+import pytest
+
+from agents.base.models import ContentType, DraftContent
+from skills.pdf_generation.pdf_generation import PdfGenerationSkill
+from skills.pptx_generation.pptx_generation import PptxGenerationSkill
+from tests.test_data import SAMPLE_ARTICLE
+
+SKILLS = [(PdfGenerationSkill, ".pdf"), (PptxGenerationSkill, ".pptx")]
+
+
+def _drafts(count):
+    # Distinct word counts identify which draft produced each result
+    return [
+        DraftContent(content=SAMPLE_ARTICLE, content_type=ContentType.ARTICLE, word_count=100 + i)
+        for i in range(count)
+    ]
+
+
+@pytest.mark.parametrize("skill_class, extension", SKILLS)
+def test_execute_batch_keeps_input_order(tmp_path, skill_class, extension):
+    skill = skill_class(config={"output_dir": str(tmp_path)})
+
+    results = skill.execute_batch(_drafts(3), max_workers=2)
+
+    assert [result["metadata"]["word_count"] for result in results] == [100, 101, 102]
+    assert all(result["file_path"].endswith(extension) for result in results)
+
+
+@pytest.mark.parametrize("skill_class, extension", SKILLS)
+def test_execute_batch_paths_are_distinct(tmp_path, skill_class, extension):
+    # Both drafts render within the same second, so only the index keeps
+    # their default names apart
+    skill = skill_class(config={"output_dir": str(tmp_path)})
+
+    paths = [result["file_path"] for result in skill.execute_batch(_drafts(2), max_workers=2)]
+
+    assert len(set(paths)) == 2
+    assert all(os.path.exists(path) for path in paths)
+
+
+@pytest.mark.parametrize("skill_class, extension", SKILLS)
+def test_execute_batch_uses_filename_as_stem(tmp_path, skill_class, extension):
+    skill = skill_class(config={"output_dir": str(tmp_path)})
+
+    results = skill.execute_batch(_drafts(2), max_workers=2, filename=f"report{extension}")
+
+    assert [os.path.basename(result["file_path"]) for result in results] == [
+        f"report_1{extension}",
+        f"report_2{extension}",
+    ]
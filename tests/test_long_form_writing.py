@@ -0,0 +1,40 @@
+"""Tests for long-form content generation."""
+
+import pytest
+
+from agents.base.models import ContentBrief, ContentType, ToneType
+from skills.long_form_writing.long_form_writing import LongFormWritingSkill
+
+
+def _brief(message):
+    return ContentBrief(
+        content_type=ContentType.ARTICLE,
+        target_audience="Engineering leaders",
+        key_messages=[message, f"{message} supporting point"],
+        tone=ToneType.PROFESSIONAL,
+        structure_requirements=["Introduction", "Conclusion"],
+        word_count_range=(800, 1200),
+    )
+
+
+@pytest.fixture(scope="module")
+def skill():
+    return LongFormWritingSkill()
+
+
+def test_execute_batch_keeps_input_order(skill):
+    briefs = [_brief(f"Topic {i}") for i in range(4)]
+    structures = ["problem_solution", "how_to", "listicle", "analysis"]
+
+    results = skill.execute_batch(briefs, structures, max_workers=4)
+
+    assert results == [skill.execute(brief, structure) for brief, structure in zip(briefs, structures)]
+
+
+def test_execute_batch_rejects_mismatched_structure_types(skill):
+    with pytest.raises(ValueError, match="Expected 2 structure types, got 1"):
+        skill.execute_batch([_brief("A"), _brief("B")], ["how_to"])
+
+
+def test_execute_batch_empty(skill):
+    assert skill.execute_batch([]) == []
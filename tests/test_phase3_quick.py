@@ -1,20 +1,34 @@
-#!/usr/bin/env python3
 """
 Quick Phase 3 Test - Runs all basic tests.
 
 Usage:
-    python3 tests/test_phase3_quick.py
+    pytest tests/test_phase3_quick.py
 """
 
-import sys
+import hashlib
 import os
+from concurrent.futures import ThreadPoolExecutor
+from importlib.util import find_spec
 
-# Add parent directory to path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import pytest
 
+from agents.base.models import ProductionOutput
 from agents.production.production import ProductionAgent
-from templates.brand.brand_config import get_brand_template
-from tests.test_data import create_test_draft
+from templates.brand.brand_config import DocumentLayout, PresentationLayout, get_brand_template
+
+TEMPLATES = ["professional", "modern", "tech", "creative", "minimal"]
+FORMATS = ["markdown", "html", "docx", "pdf", "pptx"]
+
+# Module each delegated format needs; formats without it are skipped rather
+# than exercising the HTML fallback
+DEP_FOR_FORMAT = {"docx": "docx", "pdf": "reportlab", "pptx": "pptx"}
+AVAILABLE_FORMATS = [
+    fmt for fmt in FORMATS
+    if fmt not in DEP_FOR_FORMAT or find_spec(DEP_FOR_FORMAT[fmt]) is not None
+]
+
+# Bump to invalidate outputs cached by --reuse-outputs
+OUTPUT_CACHE_VERSION = 1
 
 
 def test_dependencies():
@@ -30,126 +44,82 @@ def test_dependencies():
         "Pillow": "PIL"
     }
 
-    results = {}
-    for name, module in deps.items():
-        try:
-            __import__(module)
+    # find_spec locates each module without running its (heavy) import; the
+    # probes are filesystem-bound, so overlap them
+    with ThreadPoolExecutor(max_workers=len(deps)) as executor:
+        found = executor.map(lambda module: find_spec(module) is not None, deps.values())
+        results = dict(zip(deps, found))
+
+    for name, installed in results.items():
+        if installed:
             print(f"✓ {name:20} INSTALLED")
-            results[name] = True
-        except ImportError:
+        else:
             print(f"✗ {name:20} NOT INSTALLED (will use fallback)")
-            results[name] = False
-
-    return results
 
 
-def test_brand_templates():
+@pytest.mark.parametrize("name", TEMPLATES)
+def test_brand_template_layouts(name):
     """Test 2: Brand template enhancements."""
-    print("\n" + "="*60)
-    print("TEST 2: Brand Templates")
-    print("="*60)
-
-    templates = ["professional", "modern", "tech", "creative", "minimal"]
-
-    for name in templates:
-        template = get_brand_template(name)
+    template = get_brand_template(name)
 
-        # Verify new fields
-        assert hasattr(template, 'document_layout'), f"{name} missing document_layout"
-        assert hasattr(template, 'presentation_layout'), f"{name} missing presentation_layout"
+    # Verify new fields
+    assert isinstance(template.document_layout, DocumentLayout), f"{name} missing document_layout"
+    assert isinstance(template.presentation_layout, PresentationLayout), f"{name} missing presentation_layout"
 
-        print(f"✓ {name:12} has document & presentation layouts")
+    print(f"✓ {name:12} has document & presentation layouts")
 
-    print("\n✓ All templates validated!")
 
-
-def test_production_agent():
-    """Test 3: Production Agent."""
-    print("\n" + "="*60)
-    print("TEST 3: Production Agent")
-    print("="*60)
-
-    agent = ProductionAgent(config={
-        "output_dir": "output/quick_test",
+@pytest.fixture(scope="session")
+def agent(tmp_path_factory):
+    """Production agent shared by every format test."""
+    output_dir = tmp_path_factory.mktemp("prod_out")
+    return ProductionAgent(config={
+        "output_dir": str(output_dir),
         "brand_template": "professional"
     })
 
-    print(f"✓ Agent initialized")
-    print(f"  Brand: {agent.brand_template.name}")
-    print(f"  Output: {agent.output_dir}")
 
-    draft = create_test_draft()
-
-    # Test Markdown (always works)
-    print("\nTesting Markdown...")
-    result = agent.process({
-        "draft_content": draft,
-        "output_format": "markdown"
-    })
-    print(f"✓ Generated: {result.file_path}")
-
-    # Test HTML (always works)
-    print("\nTesting HTML...")
-    result = agent.process({
-        "draft_content": draft,
-        "output_format": "html"
-    })
-    print(f"✓ Generated: {result.file_path}")
-
-    return agent
-
-
-def test_all_formats(agent, deps):
-    """Test 4: All document formats."""
-    print("\n" + "="*60)
-    print("TEST 4: All Document Formats")
-    print("="*60)
-
-    draft = create_test_draft()
-    formats = ["docx", "pdf", "pptx"]
-
-    for fmt in formats:
-        print(f"\nTesting {fmt.upper()}...")
-        result = agent.process({
+def _produce(agent, draft, fmt, config):
+    """Produce one format, reusing a previous run's file when --reuse-outputs is set."""
+    # Opt-in: a cached run doesn't exercise the generators, so regressions
+    # in them only show up without --reuse-outputs
+    if not config.getoption("--reuse-outputs"):
+        return agent.process({
             "draft_content": draft,
             "output_format": fmt
         })
-        print(f"✓ Generated: {result.file_path}")
-        print(f"  Format: {result.file_format}")
-        if result.file_format != fmt:
-            print(f"  (Used {result.file_format} fallback)")
 
+    cache = config.cache
+    digest = hashlib.sha1(
+        "\0".join([draft.content, agent.brand_template.name, fmt]).encode("utf-8")
+    ).hexdigest()
+    key = f"prod/v{OUTPUT_CACHE_VERSION}/{digest}"
 
-def main():
-    """Run all quick tests."""
-    print("\n" + "="*60)
-    print("PHASE 3 QUICK TEST SUITE")
-    print("="*60)
+    cached = cache.get(key, None)
+    if cached and os.path.exists(cached[0]):
+        path, file_format = cached
+        return ProductionOutput(file_path=path, file_format=file_format,
+                                content_type=draft.content_type)
 
-    try:
-        # Run tests
-        deps = test_dependencies()
-        test_brand_templates()
-        agent = test_production_agent()
-        test_all_formats(agent, deps)
-
-        # Summary
-        print("\n" + "="*60)
-        print("SUMMARY")
-        print("="*60)
-        print("✓ All tests passed!")
-        print(f"\nGenerated files in: {agent.output_dir}/")
-        print("\nTo verify:")
-        print("1. Check the output directory for generated files")
-        print("2. Open DOCX, PDF, PPTX files in respective applications")
-        print("3. Verify brand colors and formatting")
-
-    except Exception as e:
-        print(f"\n✗ TEST FAILED: {e}")
-        import traceback
-        traceback.print_exc()
-        sys.exit(1)
-
-
-if __name__ == "__main__":
-    main()
+    result = agent.process({
+        "draft_content": draft,
+        "output_format": fmt
+    })
+    cache.set(key, [result.file_path, result.file_format])
+    return result
+
+
+@pytest.mark.parametrize("fmt", [
+    pytest.param(fmt, marks=pytest.mark.skipif(
+        fmt not in AVAILABLE_FORMATS,
+        reason=f"{DEP_FOR_FORMAT.get(fmt)} not installed"
+    ))
+    for fmt in FORMATS
+])
+def test_format(agent, draft, fmt, request):
+    """Test 3: Each document format whose library is installed."""
+    result = _produce(agent, draft, fmt, request.config)
+
+    assert result.file_path
+    assert result.file_format == fmt
+    print(f"✓ {fmt:8} generated: {result.file_path}")
@@ -0,0 +1,72 @@
+"""Tests for source credibility scoring and categorization."""
+
+import pytest
+
+from skills.source_eval.source_eval import _PROCESS_BATCH_THRESHOLD, SourceEvalSkill
+
+
+@pytest.fixture(scope="module")
+def skill():
+    return SourceEvalSkill()
+
+
+@pytest.mark.parametrize("url, expected", [
+    ("https://www.nature.com/articles/x", 0.95),
+    ("https://nature.com:443/x", 0.95),
+    ("https://news.nature.com/a", pytest.approx(0.95 * 0.9)),
+    ("https://nature.com.evil.io/", 0.5),
+    ("https://linkedin.com/in/someone", 0.5),
+])
+def test_score_domain_matches_label_boundaries(skill, url, expected):
+    assert skill._score_domain(url) == expected
+
+
+def test_trusted_domains_are_read_only(skill):
+    with pytest.raises(TypeError):
+        skill.trusted_domains["example.com"] = 0.9
+
+
+@pytest.mark.parametrize("url, expected", [
+    ("https://www.reuters.com/world", "news"),
+    ("https://WWW.Reuters.com/world", "news"),
+    ("https://blog.github.com/post", "community"),
+    ("https://arxiv.org/abs/1234", "academic"),
+    ("https://data.cdc.gov/x", "government"),
+    ("https://foo.gov.uk/x", "general"),
+    ("https://ieee.org.cn/x", "general"),
+    ("http://cs.mit.edu/x", "general"),
+    ("https://example.org", "general"),
+    ("not a url", "general"),
+])
+def test_categorize_source(skill, url, expected):
+    assert skill.categorize_source(url) == expected
+
+
+def _sources(count, **extra):
+    return [
+        {"url": f"https://site{i}.example.com/post", "title": f"Post {i}", **extra}
+        for i in range(count)
+    ]
+
+
+def test_evaluate_batch_keeps_input_order(skill):
+    sources = _sources(20)
+    sources[7]["url"] = "https://www.nature.com/articles/x"
+
+    results = skill.evaluate_batch(sources, max_workers=4)
+
+    assert [result.url for result in results] == [source["url"] for source in sources]
+    assert results == [skill.execute(**source) for source in sources]
+
+
+def test_evaluate_batch_process_pool_keeps_input_order(skill):
+    # Large batches with full content take the process-pool path
+    sources = _sources(_PROCESS_BATCH_THRESHOLD, full_content="Body text. " * 50)
+
+    results = skill.evaluate_batch(sources, max_workers=2)
+
+    assert [result.title for result in results] == [source["title"] for source in sources]
+
+
+def test_evaluate_batch_empty(skill):
+    assert skill.evaluate_batch([]) == []
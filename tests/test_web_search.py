@@ -0,0 +1,33 @@
+"""Tests for web search result post-processing."""
+
+import pytest
+
+from skills.web_search.web_search import WebSearchSkill
+
+
+def _titles(*titles):
+    urls = [f"https://example.com/{i}" for i in range(len(titles))]
+    return urls, [title.lower() for title in titles]
+
+
+@pytest.mark.parametrize("titles", [
+    ("AI in Healthcare - Reuters", "AI in  Healthcare | Yahoo News"),
+    ("AI in Healthcare", "ai in healthcare"),
+    ("AI in Healthcare ", "AI\tin Healthcare"),
+])
+def test_unique_indices_merges_mirrored_titles(titles):
+    assert WebSearchSkill._unique_indices(*_titles(*titles)) == [0]
+
+
+@pytest.mark.parametrize("titles", [
+    ("C++ tips", "C# tips"),
+    ("Python 3.1 release notes", "Python 31 release notes"),
+    ("E-mail security guide", "Email security guide"),
+])
+def test_unique_indices_keeps_distinct_titles(titles):
+    assert WebSearchSkill._unique_indices(*_titles(*titles)) == [0, 1]
+
+
+def test_unique_indices_drops_repeated_urls():
+    urls = ["https://example.com/a", "https://example.com/a"]
+    assert WebSearchSkill._unique_indices(urls, ["first", "second"]) == [0]